@@ -5,41 +5,74 @@ Base Agent Class - Foundation for All Debate Agents
 Provides common functionality for all AI debate agents.
 """
 
+import asyncio
+import hashlib
 import subprocess
 import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, Tuple
 from abc import ABC, abstractmethod
-import sys
+import tempfile
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.error_handler import retry_with_backoff, RetryConfig, error_logger
+from core.error_handler import aretry_with_backoff, RetryConfig, error_logger
+from core.gemini_cli import extract_ai_response, run_gemini_cli, warm_up_gemini_cli
 
 logger = logging.getLogger(__name__)
 
+# Path to Gemini CLI (assuming it's in the parent directory of the project)
+GEMINI_CLI_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "gemini-cli.js"
+)
+
+# Shared on-disk V8 compile cache so each Gemini CLI spawn skips re-parsing the bundle
+NODE_COMPILE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "a2a-node-compile-cache")
+
+# Opt-in in-memory prompt -> response cache for regression runs. Off by default:
+# replaying stored answers is exactly what the authenticity metrics flag as fake.
+PROMPT_CACHE_ENABLED = os.getenv("A2A_PROMPT_CACHE") == "1"
+
 
 class BaseDebateAgent(ABC):
     """Base class for all debate agents"""
     
+    # Response cache shared by all agents (only used when PROMPT_CACHE_ENABLED)
+    RESPONSE_CACHE_MAX = 256
+    _response_cache: "OrderedDict[str, str]" = OrderedDict()
+    
     def __init__(self, agent_id: str, name: str, role: str, personality_type: str):
         self.agent_id = agent_id
         self.name = name
         self.role = role
         self.personality_type = personality_type
-        self.conversation_history = []
+        # Bounded so long debates don't pin every prompt/response in memory
+        self.conversation_history = deque(maxlen=int(os.getenv("A2A_HISTORY_MAX", "64")))
         
         # Gemini CLI configuration
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
         if not self.gemini_api_key:
             raise ValueError("GEMINI_API_KEY環境変数が設定されていません")
         
-        # Path to Gemini CLI (assuming it's in parent directory)
-        self.gemini_cli_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-            "gemini-cli.js"
-        )
+        self.gemini_cli_path = GEMINI_CLI_PATH
+        
+        # Environment for CLI subprocesses, built once instead of copied per call.
+        # NODE_COMPILE_CACHE reuses V8 bytecode for the CLI bundle (Node 22.1+)
+        self._subprocess_env = {
+            "NODE_COMPILE_CACHE": NODE_COMPILE_CACHE_DIR,
+            **os.environ,
+            "GEMINI_API_KEY": self.gemini_api_key
+        }
+        
+        # Optional in-process SDK backend (GEMINI_BACKEND=sdk) skips the
+        # Node.js startup paid by every CLI call
+        self.gemini_backend = os.getenv("GEMINI_BACKEND", "cli")
+        self._model = None
+        if self.gemini_backend == "sdk":
+            import google.generativeai as genai
+            genai.configure(api_key=self.gemini_api_key)
+            self._model = genai.GenerativeModel(os.getenv("GEMINI_MODEL", "gemini-pro"))
         
         logger.info(f"✅ {self.name} ({self.personality_type}) 初期化完了")
     
@@ -74,11 +107,12 @@ class BaseDebateAgent(ABC):
         
         logger.info(f"🤖 {self.name}: 応答生成中...")
         
+        cache_key = None
+        if PROMPT_CACHE_ENABLED:
+            cache_key = hashlib.blake2b(full_prompt.encode('utf-8'), digest_size=16).hexdigest()
+        
         try:
             # Execute Gemini CLI with retry logic
-            env = os.environ.copy()
-            env["GEMINI_API_KEY"] = self.gemini_api_key
-            
             # Configure retry for API calls
             api_retry_config = RetryConfig(
                 max_attempts=3,
@@ -87,53 +121,35 @@ class BaseDebateAgent(ABC):
                 exponential_base=2.0
             )
             
-            @retry_with_backoff(
+            @aretry_with_backoff(
                 config=api_retry_config,
-                exceptions=(subprocess.TimeoutExpired, subprocess.CalledProcessError),
+                exceptions=(asyncio.TimeoutError, subprocess.CalledProcessError),
                 on_retry=lambda e, attempt: logger.warning(
                     f"{self.name}: Retry attempt {attempt} after error: {str(e)}"
                 )
             )
-            def call_gemini_cli():
-                start_time = time.time()
-                result = subprocess.run(
-                    ["node", self.gemini_cli_path, full_prompt],
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    timeout=60  # Increased timeout from 30s to 60s
-                )
-                end_time = time.time()
-                
-                if result.returncode != 0:
-                    error_msg = result.stderr or "Unknown error"
-                    raise subprocess.CalledProcessError(
-                        result.returncode, 
-                        ["node", self.gemini_cli_path], 
-                        output=result.stdout,
-                        stderr=error_msg
-                    )
-                
-                return result, end_time - start_time
-            
-            # Call with retry logic
-            result, response_time = call_gemini_cli()
+            async def call_gemini_cli():
+                return await self._run_gemini_cli(full_prompt)
             
-            # Extract AI response (remove debug output)
-            output_lines = result.stdout.strip().split('\n')
-            ai_response = ""
-            found_separator = False
+            ai_response = self._get_cached_response(cache_key) if cache_key else None
+            cache_hit = ai_response is not None
             
-            for line in output_lines:
-                if "===" in line and "検索中" in line:
-                    found_separator = True
-                    continue
-                if found_separator:
-                    ai_response += line + "\n"
+            if cache_hit:
+                response_time = 0.0
+                logger.info(f"♻️ {self.name}: キャッシュ済みの応答を使用")
+            elif self._model is not None:
+                ai_response, response_time = await self._call_gemini_sdk(
+                    full_prompt, api_retry_config
+                )
+            else:
+                # Call with retry logic
+                output, response_time = await call_gemini_cli()
+                
+                # Extract AI response (remove debug output)
+                ai_response = extract_ai_response(output)
             
-            ai_response = ai_response.strip()
-            if not ai_response:
-                ai_response = result.stdout.strip()
+            if cache_key and not cache_hit:
+                self._store_cached_response(cache_key, ai_response)
             
             # Store in conversation history
             self.conversation_history.append({
@@ -142,7 +158,7 @@ class BaseDebateAgent(ABC):
                 "opponent_message": opponent_message,
                 "response": ai_response,
                 "response_time": response_time,
-                "timestamp": time.strftime('%Y-%m-%d %H:%M:%S')
+                "timestamp": time.time_ns()  # epoch ns; format at render time
             })
             
             logger.info(f"✅ {self.name}: 応答生成完了 ({response_time:.2f}秒)")
@@ -165,6 +181,67 @@ class BaseDebateAgent(ABC):
             
             return user_message
     
+    async def warm_up(self):
+        """Load Node.js and the CLI bundle ahead of the first turn (no model call is made)
+        
+        The first spawn pays for reading node and the bundle from disk; doing
+        it up front keeps that cost out of turn 1's latency and response time.
+        """
+        if self._model is not None:
+            return
+        try:
+            await warm_up_gemini_cli(self.gemini_cli_path, self._subprocess_env)
+        except (OSError, asyncio.TimeoutError) as e:
+            # The real call reports a missing node with full error handling
+            logger.debug(f"{self.name}: Gemini CLI warm-up skipped: {str(e)}")
+    
+    async def _run_gemini_cli(self, prompt: str) -> Tuple[str, float]:
+        """Run the Gemini CLI once and return (raw output, response time)"""
+        return await run_gemini_cli(
+            self.gemini_cli_path,
+            prompt,
+            self._subprocess_env,
+            timeout=60  # Increased timeout from 30s to 60s
+        )
+    
+    async def _call_gemini_sdk(self, full_prompt: str, retry_config: RetryConfig):
+        """Generate a response in-process through google-generativeai"""
+        from google.api_core.exceptions import ServiceUnavailable
+        
+        @aretry_with_backoff(
+            config=retry_config,
+            exceptions=(ServiceUnavailable, asyncio.TimeoutError),
+            on_retry=lambda e, attempt: logger.warning(
+                f"{self.name}: Retry attempt {attempt} after error: {str(e)}"
+            )
+        )
+        async def call_gemini_sdk():
+            t0 = time.perf_counter()
+            response = await asyncio.wait_for(
+                self._model.generate_content_async(full_prompt),
+                timeout=60
+            )
+            response_time = time.perf_counter() - t0
+            return response.text.strip(), response_time
+        
+        return await call_gemini_sdk()
+    
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Look up a cached response, marking it most recently used"""
+        cache = BaseDebateAgent._response_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        return None
+    
+    def _store_cached_response(self, key: str, response: str):
+        """Cache a fresh response, evicting the least recently used beyond the cap"""
+        cache = BaseDebateAgent._response_cache
+        cache[key] = response
+        cache.move_to_end(key)
+        while len(cache) > self.RESPONSE_CACHE_MAX:
+            cache.popitem(last=False)
+    
     def get_agent_info(self) -> Dict[str, Any]:
         """Get agent information"""
         return {
@@ -5,39 +5,19 @@ Emotional Debater - Human Impact Focused Style
 Emphasizes human stories, emotional impact, and ethical considerations.
 """
 
+from string import Template
+
 from ..base_agent import BaseDebateAgent
 
 
-class EmotionalDebater(BaseDebateAgent):
-    """Agent that debates using emotional reasoning and human impact"""
-    
-    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
-        """
-        Args:
-            agent_id: Unique identifier for this agent
-            name: Display name for the agent
-            stance: "pro", "con", or "neutral"
-        """
-        super().__init__(
-            agent_id=agent_id,
-            name=name,
-            role=f"{stance.title()} side debater",
-            personality_type="emotional"
-        )
-        self.stance = stance
-    
-    def get_system_prompt(self, topic: str, context: str = "") -> str:
-        """Generate system prompt for emotional debate style"""
-        
-        stance_instruction = ""
-        if self.stance == "pro":
-            stance_instruction = "あなたは賛成側の立場で議論します。"
-        elif self.stance == "con":
-            stance_instruction = "あなたは反対側の立場で議論します。"
-        else:
-            stance_instruction = "あなたは中立的な立場で、人間的な影響を重視した分析を行います。"
-        
-        return f"""あなたは{self.name}という名前の人間の感情と体験を重視する議論者です。
+_STANCE_INSTRUCTIONS = {
+    "pro": "あなたは賛成側の立場で議論します。",
+    "con": "あなたは反対側の立場で議論します。",
+}
+_NEUTRAL_INSTRUCTION = "あなたは中立的な立場で、人間的な影響を重視した分析を行います。"
+
+# Parsed once at import; only name and stance vary per agent
+_PROMPT_TEMPLATE = Template("""あなたは${name}という名前の人間の感情と体験を重視する議論者です。
 
 【あなたの特徴】
 - 人間の感情、体験、ストーリーを重視します
@@ -54,7 +34,7 @@ class EmotionalDebater(BaseDebateAgent):
 - 人々の感情や価値観に寄り添った議論
 
 【立場】
-{stance_instruction}
+${stance_instruction}
 
 【注意事項】
 - 感情論に偏りすぎず、バランスを保つ
@@ -63,4 +43,33 @@ class EmotionalDebater(BaseDebateAgent):
 - 多様な価値観を尊重する姿勢を示す
 - 建設的で思いやりのある議論を心がける
 
-{context}"""
\ No newline at end of file
+""")
+
+
+class EmotionalDebater(BaseDebateAgent):
+    """Agent that debates using emotional reasoning and human impact"""
+    
+    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
+        """
+        Args:
+            agent_id: Unique identifier for this agent
+            name: Display name for the agent
+            stance: "pro", "con", or "neutral"
+        """
+        super().__init__(
+            agent_id=agent_id,
+            name=name,
+            role=f"{stance.title()} side debater",
+            personality_type="emotional"
+        )
+        self.stance = stance
+        self._prompt_prefix = self._build_prompt_prefix()
+    
+    def get_system_prompt(self, topic: str, context: str = "") -> str:
+        """Generate system prompt for emotional debate style"""
+        return self._prompt_prefix + context
+    
+    def _build_prompt_prefix(self) -> str:
+        """Build the turn-independent part of the prompt once (name and stance are fixed)"""
+        stance_instruction = _STANCE_INSTRUCTIONS.get(self.stance, _NEUTRAL_INSTRUCTION)
+        return _PROMPT_TEMPLATE.substitute(name=self.name, stance_instruction=stance_instruction)
\ No newline at end of file
@@ -5,39 +5,19 @@ Logical Debater - Data-Driven Argumentative Style
 Focuses on facts, statistics, and logical reasoning.
 """
 
+from string import Template
+
 from ..base_agent import BaseDebateAgent
 
 
-class LogicalDebater(BaseDebateAgent):
-    """Agent that debates using logical reasoning and evidence"""
-    
-    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
-        """
-        Args:
-            agent_id: Unique identifier for this agent
-            name: Display name for the agent  
-            stance: "pro", "con", or "neutral"
-        """
-        super().__init__(
-            agent_id=agent_id,
-            name=name,
-            role=f"{stance.title()} side debater", 
-            personality_type="logical"
-        )
-        self.stance = stance
-    
-    def get_system_prompt(self, topic: str, context: str = "") -> str:
-        """Generate system prompt for logical debate style"""
-        
-        stance_instruction = ""
-        if self.stance == "pro":
-            stance_instruction = "あなたは賛成側の立場で議論します。"
-        elif self.stance == "con":
-            stance_instruction = "あなたは反対側の立場で議論します。"
-        else:
-            stance_instruction = "あなたは中立的な立場で、バランスの取れた分析を行います。"
-        
-        return f"""あなたは{self.name}という名前の論理的思考に長けた議論者です。
+_STANCE_INSTRUCTIONS = {
+    "pro": "あなたは賛成側の立場で議論します。",
+    "con": "あなたは反対側の立場で議論します。",
+}
+_NEUTRAL_INSTRUCTION = "あなたは中立的な立場で、バランスの取れた分析を行います。"
+
+# Parsed once at import; only name and stance vary per agent
+_PROMPT_TEMPLATE = Template("""あなたは${name}という名前の論理的思考に長けた議論者です。
 
 【あなたの特徴】
 - データ、統計、科学的根拠を重視します
@@ -53,7 +33,7 @@ class LogicalDebater(BaseDebateAgent):
 - 結論は前提と推論から自然に導かれるように構成
 
 【立場】
-{stance_instruction}
+${stance_instruction}
 
 【注意事項】
 - 攻撃的にならず、建設的な議論を心がける
@@ -61,4 +41,33 @@ class LogicalDebater(BaseDebateAgent):
 - 複雑な概念は分かりやすく説明する
 - 議論の質を高めることを最優先とする
 
-{context}"""
\ No newline at end of file
+""")
+
+
+class LogicalDebater(BaseDebateAgent):
+    """Agent that debates using logical reasoning and evidence"""
+    
+    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
+        """
+        Args:
+            agent_id: Unique identifier for this agent
+            name: Display name for the agent  
+            stance: "pro", "con", or "neutral"
+        """
+        super().__init__(
+            agent_id=agent_id,
+            name=name,
+            role=f"{stance.title()} side debater", 
+            personality_type="logical"
+        )
+        self.stance = stance
+        self._prompt_prefix = self._build_prompt_prefix()
+    
+    def get_system_prompt(self, topic: str, context: str = "") -> str:
+        """Generate system prompt for logical debate style"""
+        return self._prompt_prefix + context
+    
+    def _build_prompt_prefix(self) -> str:
+        """Build the turn-independent part of the prompt once (name and stance are fixed)"""
+        stance_instruction = _STANCE_INSTRUCTIONS.get(self.stance, _NEUTRAL_INSTRUCTION)
+        return _PROMPT_TEMPLATE.substitute(name=self.name, stance_instruction=stance_instruction)
\ No newline at end of file
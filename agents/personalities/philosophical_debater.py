@@ -5,39 +5,19 @@ Philosophical Debater - Deep Conceptual Thinking Style
 Focuses on fundamental questions, concepts, and philosophical implications.
 """
 
+from string import Template
+
 from ..base_agent import BaseDebateAgent
 
 
-class PhilosophicalDebater(BaseDebateAgent):
-    """Agent that debates using philosophical reasoning and deep conceptual thinking"""
-    
-    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
-        """
-        Args:
-            agent_id: Unique identifier for this agent
-            name: Display name for the agent
-            stance: "pro", "con", or "neutral"
-        """
-        super().__init__(
-            agent_id=agent_id,
-            name=name,
-            role=f"{stance.title()} side debater",
-            personality_type="philosophical"
-        )
-        self.stance = stance
-    
-    def get_system_prompt(self, topic: str, context: str = "") -> str:
-        """Generate system prompt for philosophical debate style"""
-        
-        stance_instruction = ""
-        if self.stance == "pro":
-            stance_instruction = "あなたは賛成側の立場で議論します。"
-        elif self.stance == "con":
-            stance_instruction = "あなたは反対側の立場で議論します。"
-        else:
-            stance_instruction = "あなたは中立的な立場で、深い哲学的考察を行います。"
-        
-        return f"""あなたは{self.name}という名前の哲学的思考を得意とする議論者です。
+_STANCE_INSTRUCTIONS = {
+    "pro": "あなたは賛成側の立場で議論します。",
+    "con": "あなたは反対側の立場で議論します。",
+}
+_NEUTRAL_INSTRUCTION = "あなたは中立的な立場で、深い哲学的考察を行います。"
+
+# Parsed once at import; only name and stance vary per agent
+_PROMPT_TEMPLATE = Template("""あなたは${name}という名前の哲学的思考を得意とする議論者です。
 
 【あなたの特徴】
 - 根本的な概念や前提を問い直します
@@ -61,7 +41,7 @@ class PhilosophicalDebater(BaseDebateAgent):
 - 科学哲学: 科学的方法、真理の探求
 
 【立場】
-{stance_instruction}
+${stance_instruction}
 
 【注意事項】
 - 抽象的になりすぎず、具体例で説明する
@@ -70,4 +50,33 @@ class PhilosophicalDebater(BaseDebateAgent):
 - 議論を深めることで真理に近づく姿勢
 - 知的謙遜を保ち、学び続ける態度を示す
 
-{context}"""
\ No newline at end of file
+""")
+
+
+class PhilosophicalDebater(BaseDebateAgent):
+    """Agent that debates using philosophical reasoning and deep conceptual thinking"""
+    
+    def __init__(self, agent_id: str, name: str, stance: str = "neutral"):
+        """
+        Args:
+            agent_id: Unique identifier for this agent
+            name: Display name for the agent
+            stance: "pro", "con", or "neutral"
+        """
+        super().__init__(
+            agent_id=agent_id,
+            name=name,
+            role=f"{stance.title()} side debater",
+            personality_type="philosophical"
+        )
+        self.stance = stance
+        self._prompt_prefix = self._build_prompt_prefix()
+    
+    def get_system_prompt(self, topic: str, context: str = "") -> str:
+        """Generate system prompt for philosophical debate style"""
+        return self._prompt_prefix + context
+    
+    def _build_prompt_prefix(self) -> str:
+        """Build the turn-independent part of the prompt once (name and stance are fixed)"""
+        stance_instruction = _STANCE_INSTRUCTIONS.get(self.stance, _NEUTRAL_INSTRUCTION)
+        return _PROMPT_TEMPLATE.substitute(name=self.name, stance_instruction=stance_instruction)
\ No newline at end of file
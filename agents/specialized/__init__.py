@@ -7,5 +7,6 @@ Pre-configured agents for specific debate scenarios.
 
 from .debate_agent_a import DebateAgentA
 from .debate_agent_b import DebateAgentB
+from .factory import build
 
-__all__ = ["DebateAgentA", "DebateAgentB"]
\ No newline at end of file
+__all__ = ["DebateAgentA", "DebateAgentB", "build"]
\ No newline at end of file
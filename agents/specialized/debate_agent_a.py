@@ -6,9 +6,13 @@ Pre-configured agent that takes the "pro" or affirmative side in debates.
 Can use different personality types.
 """
 
+from typing import Optional
+
+from ..base_agent import BaseDebateAgent
 from ..personalities.logical_debater import LogicalDebater
 from ..personalities.emotional_debater import EmotionalDebater
 from ..personalities.philosophical_debater import PhilosophicalDebater
+from .factory import build
 
 
 class DebateAgentA:
@@ -17,41 +21,19 @@ class DebateAgentA:
     @staticmethod
     def create_logical(name: str = "Logic Pro") -> LogicalDebater:
         """Create a logical pro-side debater"""
-        return LogicalDebater(
-            agent_id="agent_a_logical",
-            name=name,
-            stance="pro"
-        )
+        return build("pro", "logical", name)
     
     @staticmethod
     def create_emotional(name: str = "Heart Pro") -> EmotionalDebater:
         """Create an emotional pro-side debater"""
-        return EmotionalDebater(
-            agent_id="agent_a_emotional",
-            name=name,
-            stance="pro"
-        )
+        return build("pro", "emotional", name)
     
     @staticmethod
     def create_philosophical(name: str = "Wisdom Pro") -> PhilosophicalDebater:
         """Create a philosophical pro-side debater"""
-        return PhilosophicalDebater(
-            agent_id="agent_a_philosophical",
-            name=name,
-            stance="pro"
-        )
+        return build("pro", "philosophical", name)
     
     @staticmethod
-    def create_default(personality: str = "logical", name: str = None) -> any:
+    def create_default(personality: str = "logical", name: Optional[str] = None) -> BaseDebateAgent:
         """Create default pro-side agent with specified personality"""
-        if name is None:
-            name = f"{personality.title()} Pro"
-        
-        if personality == "logical":
-            return DebateAgentA.create_logical(name)
-        elif personality == "emotional":
-            return DebateAgentA.create_emotional(name)
-        elif personality == "philosophical":
-            return DebateAgentA.create_philosophical(name)
-        else:
-            raise ValueError(f"Unknown personality type: {personality}")
\ No newline at end of file
+        return build("pro", personality, name)
\ No newline at end of file
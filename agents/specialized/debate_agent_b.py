@@ -6,9 +6,13 @@ Pre-configured agent that takes the "con" or negative side in debates.
 Can use different personality types.
 """
 
+from typing import Optional
+
+from ..base_agent import BaseDebateAgent
 from ..personalities.logical_debater import LogicalDebater
 from ..personalities.emotional_debater import EmotionalDebater
 from ..personalities.philosophical_debater import PhilosophicalDebater
+from .factory import build
 
 
 class DebateAgentB:
@@ -17,41 +21,19 @@ class DebateAgentB:
     @staticmethod
     def create_logical(name: str = "Logic Con") -> LogicalDebater:
         """Create a logical con-side debater"""
-        return LogicalDebater(
-            agent_id="agent_b_logical",
-            name=name,
-            stance="con"
-        )
+        return build("con", "logical", name)
     
     @staticmethod
     def create_emotional(name: str = "Heart Con") -> EmotionalDebater:
         """Create an emotional con-side debater"""
-        return EmotionalDebater(
-            agent_id="agent_b_emotional", 
-            name=name,
-            stance="con"
-        )
+        return build("con", "emotional", name)
     
     @staticmethod
     def create_philosophical(name: str = "Wisdom Con") -> PhilosophicalDebater:
         """Create a philosophical con-side debater"""
-        return PhilosophicalDebater(
-            agent_id="agent_b_philosophical",
-            name=name,
-            stance="con"
-        )
+        return build("con", "philosophical", name)
     
     @staticmethod
-    def create_default(personality: str = "logical", name: str = None) -> any:
+    def create_default(personality: str = "logical", name: Optional[str] = None) -> BaseDebateAgent:
         """Create default con-side agent with specified personality"""
-        if name is None:
-            name = f"{personality.title()} Con"
-        
-        if personality == "logical":
-            return DebateAgentB.create_logical(name)
-        elif personality == "emotional":
-            return DebateAgentB.create_emotional(name)
-        elif personality == "philosophical":
-            return DebateAgentB.create_philosophical(name)
-        else:
-            raise ValueError(f"Unknown personality type: {personality}")
\ No newline at end of file
+        return build("con", personality, name)
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Debate Agent Factory - Table-Driven Agent Builder
+=================================================
+
+Single builder shared by DebateAgentA and DebateAgentB. Personalities are
+looked up in a dict instead of an if/elif chain on every call.
+"""
+
+from typing import Optional
+
+from ..base_agent import BaseDebateAgent
+from ..personalities.logical_debater import LogicalDebater
+from ..personalities.emotional_debater import EmotionalDebater
+from ..personalities.philosophical_debater import PhilosophicalDebater
+
+
+_PERSONALITIES = {
+    "logical": LogicalDebater,
+    "emotional": EmotionalDebater,
+    "philosophical": PhilosophicalDebater,
+}
+
+# Stance -> side letter used in agent ids (agent_a_*, agent_b_*)
+_SIDES = {"pro": "a", "con": "b"}
+
+
+def build(stance: str, personality: str, name: Optional[str] = None) -> BaseDebateAgent:
+    """Create a debate agent for the given stance and personality"""
+    try:
+        cls = _PERSONALITIES[personality]
+    except KeyError:
+        raise ValueError(f"Unknown personality type: {personality}") from None
+    
+    side = _SIDES.get(stance)
+    if side is None:
+        raise ValueError(f"Unknown stance: {stance} (expected one of: {', '.join(_SIDES)})")
+    
+    return cls(
+        agent_id=f"agent_{side}_{personality}",
+        name=name or f"{personality.title()} {stance.title()}",
+        stance=stance
+    )
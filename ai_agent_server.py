@@ -1,26 +1,23 @@
 """A2A AI Agent Server - Gemini搭載の本格的なAIエージェント"""
 import asyncio
-import json
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Union
 from uuid import uuid4
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
-from dotenv import load_dotenv
 import subprocess
 import os
+import tempfile
+import time
 
+from core.gemini_cli import extract_ai_response, run_gemini_cli
 from a2a_types import (
     AgentCard, AgentSkill, AgentCapabilities, 
     Message, Part, TextPart, Role, Task, TaskStatus
 )
 
-# 環境変数を読み込み
-load_dotenv()
-
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +25,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("A2A-AI-Agent")
 
+# Gemini CLI起動ごとのJSパースを省くためのV8コンパイルキャッシュ
+NODE_COMPILE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "a2a-node-compile-cache")
+
+# 1回のJSON-RPCバッチで受け付けるリクエストの上限（CLIの同時起動数を抑える）
+MAX_BATCH_SIZE = int(os.getenv("A2A_MAX_BATCH_SIZE", "8"))
+
 
 class GeminiAIAgent:
     """Gemini AIを使用するA2Aエージェント"""
@@ -45,6 +48,25 @@ class GeminiAIAgent:
         # Gemini CLIのパス（親ディレクトリから相対パス）
         self.gemini_cli_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gemini-cli.js")
         
+        # CLI実行用の環境変数（呼び出しごとにコピーせず一度だけ作成）
+        # NODE_COMPILE_CACHE: CLIバンドルのV8コンパイル結果を起動間で再利用 (Node 22.1+)
+        self._subprocess_env = {
+            "NODE_COMPILE_CACHE": NODE_COMPILE_CACHE_DIR,
+            **os.environ,
+            "GEMINI_API_KEY": self.gemini_api_key
+        }
+        
+        # GEMINI_BACKEND=sdk でNode.jsを起動せずプロセス内SDKを使用
+        self.gemini_backend = os.getenv("GEMINI_BACKEND", "cli")
+        # CLIは自身の設定でモデルを選ぶため、名前が分かるのはSDK使用時のみ
+        self.ai_model = "gemini-cli"
+        self._model = None
+        if self.gemini_backend == "sdk":
+            import google.generativeai as genai
+            genai.configure(api_key=self.gemini_api_key)
+            self.ai_model = os.getenv("GEMINI_MODEL", "gemini-pro")
+            self._model = genai.GenerativeModel(self.ai_model)
+        
         # エージェントのシステムプロンプト
         self.system_prompt = f"""あなたは{self.name}という名前のAIエージェントです。
 役割: {self.role}
@@ -59,74 +81,161 @@ class GeminiAIAgent:
         
         try:
             # プロンプトを作成
-            prompt = f"{self.system_prompt}\n\nユーザーからのメッセージ: {message}\n\n返答:"
+            prompt = self._build_prompt(message)
             
-            # Gemini CLIを実行
-            env = os.environ.copy()
-            env["GEMINI_API_KEY"] = self.gemini_api_key
+            if self._model is not None:
+                logger.info(f"🚀 Gemini SDK実行 (プロンプト長: {len(prompt)} 文字)")
+                response = await asyncio.wait_for(
+                    self._model.generate_content_async(prompt),
+                    timeout=30
+                )
+                ai_response = response.text.strip()
+                logger.info(f"📏 AI応答長: {len(ai_response)} 文字")
+                return ai_response
             
+            # Gemini CLIを実行
             # コマンドをログに記録
             logger.info(f"🚀 Gemini CLI実行: node {self.gemini_cli_path}")
             logger.info(f"📝 プロンプト長: {len(prompt)} 文字")
             
-            result = subprocess.run(
-                ["node", self.gemini_cli_path, prompt],
-                capture_output=True,
-                text=True,
-                env=env,
+            # エージェントと共通の非同期サブプロセス実行（タイムアウト時はkill）
+            output, _ = await run_gemini_cli(
+                self.gemini_cli_path,
+                prompt,
+                self._subprocess_env,
                 timeout=30
             )
+            logger.info(f"✅ Gemini CLI実行成功")
+            logger.info(f"📊 出力サイズ: {len(output)} 文字")
             
-            if result.returncode == 0:
-                logger.info(f"✅ Gemini CLI実行成功")
-                logger.info(f"📊 出力サイズ: {len(result.stdout)} 文字")
-                
-                # 出力から実際のAI応答を抽出（デバッグ情報を除去）
-                output_lines = result.stdout.strip().split('\n')
-                # "==" を含む行より後の内容を取得
-                ai_response = ""
-                found_separator = False
-                for line in output_lines:
-                    if "===" in line and "検索中" in line:
-                        found_separator = True
-                        continue
-                    if found_separator:
-                        ai_response += line + "\n"
-                
-                ai_response = ai_response.strip()
-                if not ai_response:
-                    ai_response = result.stdout.strip()
-                
-                logger.info(f"🤖 AI応答（最初の100文字）: '{ai_response[:100]}...'")
-                logger.info(f"📏 AI応答長: {len(ai_response)} 文字")
-                return ai_response
-            else:
-                error_msg = result.stderr or "不明なエラー"
-                logger.error(f"❌ Gemini CLIエラー: {error_msg}")
-                return f"申し訳ありません。エラーが発生しました: {error_msg}"
+            # 出力から実際のAI応答を抽出（デバッグ情報を除去）
+            ai_response = extract_ai_response(output)
+            
+            logger.info(f"🤖 AI応答（最初の100文字）: '{ai_response[:100]}...'")
+            logger.info(f"📏 AI応答長: {len(ai_response)} 文字")
+            return ai_response
             
-        except subprocess.TimeoutExpired:
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr or "不明なエラー"
+            logger.error(f"❌ Gemini CLIエラー: {error_msg}")
+            return f"申し訳ありません。エラーが発生しました: {error_msg}"
+        except asyncio.TimeoutError:
             logger.error("❌ Gemini CLI タイムアウト")
             return "申し訳ありません。処理がタイムアウトしました。"
         except Exception as e:
             logger.error(f"❌ Gemini CLI実行エラー: {str(e)}")
             return f"申し訳ありません。エラーが発生しました: {str(e)}"
 
+    
+    async def warm_up(self) -> None:
+        """短いプロンプトを一度流してCLI/SDKを暖機"""
+        start = time.perf_counter()
+        try:
+            await self.process_message("ping")
+            logger.info(f"🔥 ウォームアップ完了 ({time.perf_counter() - start:.2f}秒)")
+        except Exception as e:
+            logger.warning(f"⚠️ ウォームアップ失敗: {str(e)}")
+    
+    async def stream_message(self, message: str) -> AsyncIterator[str]:
+        """Gemini CLIの出力を区切り行以降から1行ずつ返す（SSE用）"""
+        logger.info(f"📥 受信メッセージ(ストリーム): '{message}'")
+        prompt = self._build_prompt(message)
+        
+        # CLI・SDKとも、process_messageと同じ30秒の制限を読み取り全体にかける
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 30
+        
+        if self._model is not None:
+            streamed = False
+            try:
+                response = await asyncio.wait_for(
+                    self._model.generate_content_async(prompt, stream=True),
+                    timeout=deadline - loop.time()
+                )
+                chunks = response.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=deadline - loop.time())
+                    except StopAsyncIteration:
+                        break
+                    
+                    # ブロック・空候補のチャンクは.textでValueErrorになる
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        block_reason = getattr(getattr(chunk, "prompt_feedback", None), "block_reason", None)
+                        if block_reason:
+                            raise RuntimeError(f"Gemini SDKが応答をブロックしました: {block_reason}")
+                        continue
+                    streamed = True
+                    yield text
+            except asyncio.TimeoutError:
+                logger.error("❌ Gemini SDK タイムアウト (ストリーム)")
+                raise TimeoutError("Gemini SDK タイムアウト (30秒)")
+            
+            # テキストが1つも無ければFAILEDとしてクライアントに伝える
+            if not streamed:
+                raise RuntimeError("Gemini SDKの応答が空です（ブロックされた可能性があります）")
+            return
+        
+        proc = await asyncio.create_subprocess_exec(
+            "node", self.gemini_cli_path, prompt,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._subprocess_env
+        )
+        # stderrは並行して読み切る（パイプが詰まってCLIが止まらないように）
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        
+        async def read_line() -> bytes:
+            return await asyncio.wait_for(proc.stdout.readline(), timeout=deadline - loop.time())
+        
+        # 区切り行が来るまでの出力は、区切りが無かった場合のためだけに保持
+        head = bytearray()
+        found_separator = False
+        try:
+            try:
+                while True:
+                    line = await read_line()
+                    if not line:
+                        break
+                    # 区切り行は最初のもの以降もすべて読み飛ばす
+                    if b"===" in line and "検索中".encode("utf-8") in line:
+                        found_separator = True
+                    elif found_separator:
+                        yield line.decode('utf-8', errors='replace')
+                    else:
+                        head += line
+                
+                await asyncio.wait_for(proc.wait(), timeout=deadline - loop.time())
+                stderr = await stderr_task
+            except asyncio.TimeoutError:
+                logger.error("❌ Gemini CLI タイムアウト (ストリーム)")
+                raise TimeoutError("Gemini CLI タイムアウト (30秒)")
+            
+            # 異常終了はFAILEDとしてクライアントに伝える（デバッグ出力は流さない）
+            if proc.returncode != 0:
+                error_msg = stderr.decode('utf-8', errors='replace').strip() or "不明なエラー"
+                logger.error(f"❌ Gemini CLIエラー (終了コード {proc.returncode}): {error_msg}")
+                raise RuntimeError(f"Gemini CLIエラー (終了コード {proc.returncode}): {error_msg}")
+            
+            if not found_separator and head:
+                yield head.decode('utf-8', errors='replace')
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+    
+    def _build_prompt(self, message: str) -> str:
+        """システムプロンプトとユーザーメッセージからプロンプトを作成"""
+        return f"{self.system_prompt}\n\nユーザーからのメッセージ: {message}\n\n返答:"
 
-# コマンドライン引数からエージェント設定を取得
-import sys
-agent_name = sys.argv[1] if len(sys.argv) > 1 else "研究者エージェント"
-agent_role = sys.argv[2] if len(sys.argv) > 2 else "技術的な質問に答える専門家"
-port = int(sys.argv[3]) if len(sys.argv) > 3 else 9999
-
-# エージェントインスタンス
-agent = GeminiAIAgent(agent_name, agent_role)
-
-# FastAPIアプリケーション
-app = FastAPI(title=f"A2A {agent_name}")
 
 
-def create_agent_card() -> AgentCard:
+def create_agent_card(agent: GeminiAIAgent, port: int) -> AgentCard:
     """エージェントカードを作成"""
     skill = AgentSkill(
         id="ai_conversation",
@@ -146,28 +255,13 @@ def create_agent_card() -> AgentCard:
         url=f"http://localhost:{port}",
         version="2.0.0",
         capabilities=AgentCapabilities(
-            streaming=False,
+            streaming=True,
             pushNotifications=False
         ),
         skills=[skill]
     )
 
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info("🚀 A0A AIサーバー起動中...")
-    logger.info(f"🤖 エージェント名: {agent.name}")
-    logger.info(f"📍 エージェントカード: http://localhost:{port}/.well-known/agent.json")
-
-
-@app.get("/.well-known/agent.json")
-async def get_agent_card():
-    """エージェントカードを返す (A2A Discovery)"""
-    logger.info("🔍 エージェントカードがリクエストされました")
-    card = create_agent_card()
-    return card
-
-
 class SendMessageRequest(BaseModel):
     """メッセージ送信リクエスト"""
     id: str
@@ -175,30 +269,149 @@ class SendMessageRequest(BaseModel):
     params: Dict[str, Any]
 
 
-@app.post("/tasks/send")
-async def send_task(request: SendMessageRequest):
-    """タスクを受信して処理 (A2A Task Send)"""
-    logger.info("=" * 50)
-    logger.info("📨 新しいタスクリクエスト受信")
-    logger.info(f"リクエストID: {request.id}")
+def create_app(agent: GeminiAIAgent, port: int):
+    """FastAPIアプリケーションを作成（サーバー起動時のみFastAPIを読み込む）"""
+    import orjson
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse, StreamingResponse
+    
+    # 長い日本語応答を含むJSON-RPCレスポンスはorjsonで直接バイト列にエンコード
+    app = FastAPI(title=f"A2A {agent.name}", default_response_class=ORJSONResponse)
+    
+    @app.on_event("startup")
+    async def startup_event():
+        logger.info("🚀 A0A AIサーバー起動中...")
+        logger.info(f"🤖 エージェント名: {agent.name}")
+        logger.info(f"📍 エージェントカード: http://localhost:{port}/.well-known/agent.json")
+        
+        # 最初のタスクでNode/SDKのコールドスタートを払わないよう起動時に一度実行
+        # (A2A_WARMUP=0 で無効化)
+        if os.getenv("A2A_WARMUP", "1") != "0":
+            await agent.warm_up()
     
-    try:
-        # リクエストからメッセージを抽出
+    @app.get("/.well-known/agent.json")
+    async def get_agent_card():
+        """エージェントカードを返す (A2A Discovery)"""
+        logger.info("🔍 エージェントカードがリクエストされました")
+        card = create_agent_card(agent, port)
+        return card
+    
+    @app.post("/tasks/send")
+    async def send_task(request: Union[SendMessageRequest, List[SendMessageRequest]]):
+        """タスクを受信して処理 (A2A Task Send, JSON-RPC 2.0バッチ対応)"""
+        if isinstance(request, list):
+            # 空配列・上限超過のバッチは単一のInvalid Requestエラーで返す (JSON-RPC 2.0)
+            if not request:
+                return invalid_request("Invalid Request")
+            if len(request) > MAX_BATCH_SIZE:
+                logger.warning(f"⚠️ バッチ上限超過 ({len(request)}件 > {MAX_BATCH_SIZE}件)")
+                return invalid_request(f"Invalid Request: batch exceeds {MAX_BATCH_SIZE} requests")
+            
+            # バッチ: 1往復で受け取った複数リクエストを並行処理し、配列で返す
+            logger.info(f"📦 バッチリクエスト受信 ({len(request)}件)")
+            return list(await asyncio.gather(*(handle_send(r) for r in request)))
+        return await handle_send(request)
+    
+    def invalid_request(message: str) -> Dict[str, Any]:
+        """id不明のJSON-RPC Invalid Requestエラー"""
+        return {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32600,
+                "message": message
+            },
+            "id": None
+        }
+    
+    async def handle_send(request: SendMessageRequest) -> Dict[str, Any]:
+        """単一のtasks/sendリクエストを処理"""
+        logger.info("=" * 50)
+        logger.info("📨 新しいタスクリクエスト受信")
+        logger.info(f"リクエストID: {request.id}")
+        
+        try:
+            # リクエストからメッセージを抽出
+            params = request.params
+            task_id = params.get("taskId", str(uuid4()))
+            message_data = params.get("message", {})
+            
+            logger.info(f"タスクID: {task_id}")
+            
+            # メッセージをパース
+            if message_data and "parts" in message_data:
+                user_text = message_data["parts"][0].get("text", "")
+            else:
+                user_text = ""
+            
+            logger.info(f"ユーザーメッセージ: '{user_text}'")
+            
+            # タスクを作成
+            task = Task(
+                id=task_id,
+                status=TaskStatus.WORKING,
+                message=Message(
+                    role=Role.USER,
+                    parts=[Part(root=TextPart(text=user_text))]
+                )
+            )
+            agent.tasks[task_id] = task
+            logger.info(f"⚙️  タスク処理開始 (ID: {task_id})")
+            
+            # AIでメッセージを処理
+            response_text = await agent.process_message(user_text)
+            
+            # タスクを完了
+            task.status = TaskStatus.COMPLETED
+            task.result = Message(
+                role=Role.AGENT,
+                parts=[Part(root=TextPart(text=response_text))]
+            )
+            
+            logger.info(f"✅ タスク完了 (ID: {task_id})")
+            
+            # レスポンスを返す
+            response = {
+                "jsonrpc": "2.0",
+                "id": request.id,
+                "result": {
+                    "taskId": task_id,
+                    "status": task.status.value,
+                    "message": {
+                        "role": task.result.role.value,
+                        "parts": [{"text": response_text}]
+                    }
+                }
+            }
+            
+            logger.info("📤 レスポンス送信")
+            logger.info("=" * 50)
+            
+            return response
+        
+        except Exception as e:
+            logger.error(f"❌ エラー発生: {str(e)}")
+            return {
+                "jsonrpc": "2.0",
+                "id": request.id,
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            }
+    
+    @app.post("/tasks/sendStream")
+    async def send_task_stream(request: SendMessageRequest):
+        """タスクを受信して応答をSSEで逐次送信 (A2A Task Streaming)"""
+        logger.info(f"📨 ストリーミングタスク受信 (リクエストID: {request.id})")
+        
         params = request.params
         task_id = params.get("taskId", str(uuid4()))
         message_data = params.get("message", {})
-        
-        logger.info(f"タスクID: {task_id}")
-        
-        # メッセージをパース
         if message_data and "parts" in message_data:
             user_text = message_data["parts"][0].get("text", "")
         else:
             user_text = ""
         
-        logger.info(f"ユーザーメッセージ: '{user_text}'")
-        
-        # タスクを作成
         task = Task(
             id=task_id,
             status=TaskStatus.WORKING,
@@ -208,68 +421,82 @@ async def send_task(request: SendMessageRequest):
             )
         )
         agent.tasks[task_id] = task
-        logger.info(f"⚙️  タスク処理開始 (ID: {task_id})")
-        
-        # AIでメッセージを処理
-        response_text = await agent.process_message(user_text)
-        
-        # タスクを完了
-        task.status = TaskStatus.COMPLETED
-        task.result = Message(
-            role=Role.AGENT,
-            parts=[Part(root=TextPart(text=response_text))]
-        )
-        
-        logger.info(f"✅ タスク完了 (ID: {task_id})")
         
-        # レスポンスを返す
-        response = {
-            "jsonrpc": "2.0",
-            "id": request.id,
-            "result": {
-                "taskId": task_id,
-                "status": task.status.value,
-                "message": {
-                    "role": task.result.role.value,
-                    "parts": [{"text": response_text}]
+        def sse_event(status: TaskStatus, text: str) -> bytes:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": request.id,
+                "result": {
+                    "taskId": task_id,
+                    "status": status.value,
+                    "message": {
+                        "role": Role.AGENT.value,
+                        "parts": [{"text": text}]
+                    }
                 }
             }
-        }
-        
-        logger.info("📤 レスポンス送信")
-        logger.info("=" * 50)
+            return b"data: " + orjson.dumps(payload) + b"\n\n"
         
-        return response
+        async def event_stream():
+            chunks = []
+            try:
+                async for chunk in agent.stream_message(user_text):
+                    chunks.append(chunk)
+                    yield sse_event(TaskStatus.WORKING, chunk)
+            except Exception as e:
+                logger.error(f"❌ ストリーミングエラー: {str(e)}")
+                task.status = TaskStatus.FAILED
+                task.error = str(e)
+                yield sse_event(TaskStatus.FAILED, f"申し訳ありません。エラーが発生しました: {str(e)}")
+                return
+            
+            response_text = "".join(chunks).strip()
+            task.status = TaskStatus.COMPLETED
+            task.result = Message(
+                role=Role.AGENT,
+                parts=[Part(root=TextPart(text=response_text))]
+            )
+            logger.info(f"✅ ストリーミングタスク完了 (ID: {task_id})")
+            yield sse_event(TaskStatus.COMPLETED, response_text)
         
-    except Exception as e:
-        logger.error(f"❌ エラー発生: {str(e)}")
-        return {
-            "jsonrpc": "2.0",
-            "id": request.id,
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            }
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+    
+    @app.get("/health")
+    async def health_check():
+        """ヘルスチェック"""
+        status = {
+            "status": "healthy",
+            "agent": agent.name,
+            "role": agent.role,
+            "backend": agent.gemini_backend,
+            "ai_model": agent.ai_model,
+            "batch": True,
+            "timestamp": datetime.utcnow().isoformat(),
+            "tasks_count": len(agent.tasks)
         }
-
-
-@app.get("/health")
-async def health_check():
-    """ヘルスチェック"""
-    status = {
-        "status": "healthy",
-        "agent": agent.name,
-        "role": agent.role,
-        "ai_model": "gemini-cli",
-        "timestamp": datetime.utcnow().isoformat(),
-        "tasks_count": len(agent.tasks)
-    }
-    logger.info(f"💚 ヘルスチェック: {status}")
-    return status
+        logger.info(f"💚 ヘルスチェック: {status}")
+        return status
+    
+    return app
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
+    from dotenv import load_dotenv
+    
+    # 環境変数を読み込み
+    load_dotenv()
+    
+    # コマンドライン引数からエージェント設定を取得
+    agent_name = sys.argv[1] if len(sys.argv) > 1 else "研究者エージェント"
+    agent_role = sys.argv[2] if len(sys.argv) > 2 else "技術的な質問に答える専門家"
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else 9999
+    
+    # エージェントインスタンス
+    agent = GeminiAIAgent(agent_name, agent_role)
+    app = create_app(agent, port)
+    
     print("\n" + "=" * 60)
     print("🤖 A2A AI Agent Protocol - Gemini搭載")
     print("=" * 60)
@@ -2,50 +2,57 @@
 import asyncio
 import httpx
 import json
-from uuid import uuid4
+import orjson
 from pprint import pprint
+import os
 import time
+from collections import deque
 
+from core.protocol_handler import A2AProtocolHandler
 
-async def send_message_to_agent(agent_url: str, message: str) -> str:
+# 1エージェントの持ち時間（秒）。超えたら発言権を相手に渡す
+TURN_TIMEOUT = float(os.getenv("DEMO_TURN_TIMEOUT", "20"))
+
+# リクエスト生成用（タスク状態は持たないので共有して使う）
+_protocol = A2AProtocolHandler()
+
+# まとめ表示用にメモリに保持する直近の発言数（全文はJSONLに保存）
+HISTORY_TAIL = 20
+CONVERSATION_LOG_DIR = os.path.join("discussions", "logs")
+
+
+def _append_jsonl(path: str, item: dict):
+    """JSONLファイルに1行追記"""
+    with open(path, "ab") as f:
+        f.write(orjson.dumps(item) + b"\n")
+
+
+async def send_message_to_agent(client: httpx.AsyncClient, agent_url: str, message: str) -> str:
     """エージェントにメッセージを送信して応答を取得"""
-    task_id = str(uuid4())
-    request_id = str(uuid4())
-    
-    request_data = {
-        "id": request_id,
-        "method": "tasks/send",
-        "params": {
-            "taskId": task_id,
-            "message": {
-                "role": "user",
-                "parts": [{"text": message}]
-            }
-        }
-    }
+    # 固定部分はシリアライズ済みのテンプレートに、id・taskId・本文だけを埋め込む
+    request_body = _protocol.create_message_request_bytes(message)
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                f"{agent_url}/tasks/send",
-                json=request_data,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "result" in result and "message" in result["result"]:
-                    return result["result"]["message"]["parts"][0]["text"]
-            else:
-                print(f"Error: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            print(f"通信エラー: {str(e)}")
+    try:
+        response = await client.post(
+            f"{agent_url}/tasks/send",
+            content=request_body,
+            headers={"Content-Type": "application/json"}
+        )
+        
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            if "result" in result and "message" in result["result"]:
+                return result["result"]["message"]["parts"][0]["text"]
+        else:
+            print(f"Error: {response.status_code}")
             return None
+            
+    except Exception as e:
+        print(f"通信エラー: {str(e)}")
+        return None
 
 
-async def ai_conversation_demo():
+async def ai_conversation_demo(client: httpx.AsyncClient):
     """2つのAIエージェントによる会話デモ"""
     
     # エージェントのURL
@@ -60,8 +67,28 @@ async def ai_conversation_demo():
     print("\n会話を開始します...\n")
     print("=" * 70 + "\n")
     
-    # 会話の開始
-    conversation_history = []
+    # 会話の開始（メモリには直近のみ保持し、全発言はバックグラウンドでJSONLへ書き出す）
+    conversation_history = deque(maxlen=HISTORY_TAIL)
+    message_count = 0
+    os.makedirs(CONVERSATION_LOG_DIR, exist_ok=True)
+    log_path = os.path.join(CONVERSATION_LOG_DIR, f"conversation_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+    writer_queue: asyncio.Queue = asyncio.Queue()
+    
+    async def writer():
+        while True:
+            item = await writer_queue.get()
+            try:
+                await asyncio.to_thread(_append_jsonl, log_path, item)
+            finally:
+                writer_queue.task_done()
+    
+    def record(agent: str, message: str, turn: int):
+        nonlocal message_count
+        message_count += 1
+        conversation_history.append((agent, message))
+        writer_queue.put_nowait({"turn": turn, "agent": agent, "message": message})
+    
+    writer_task = asyncio.create_task(writer())
     current_message = "AIの進化は人類にとってどのような意味を持つと思いますか？"
     
     for turn in range(5):  # 5往復の会話
@@ -69,42 +96,65 @@ async def ai_conversation_demo():
         
         # エージェント1に送信
         print(f"\n👤 → 研究者エージェント: {current_message}")
-        response1 = await send_message_to_agent(agent1_url, current_message)
-        
-        if response1:
+        try:
+            response1 = await asyncio.wait_for(
+                send_message_to_agent(client, agent1_url, current_message),
+                timeout=TURN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # 持ち時間切れ: 同じメッセージに哲学者が答える
+            print(f"\n⏱️ 研究者エージェントが持ち時間（{TURN_TIMEOUT:g}秒）を超えたため、哲学者エージェントに発言権を渡します")
+            response1 = current_message
+        else:
+            if not response1:
+                print("研究者エージェントからの応答がありません")
+                break
+            
             print(f"\n🔬 研究者エージェント: {response1}")
-            conversation_history.append(("研究者", response1))
+            record("研究者", response1, turn + 1)
             
             # 少し待機
             await asyncio.sleep(2)
-            
-            # エージェント2に研究者の応答を送信
-            print(f"\n🔬 → 哲学者エージェント: {response1}")
-            response2 = await send_message_to_agent(agent2_url, response1)
-            
-            if response2:
-                print(f"\n🤔 哲学者エージェント: {response2}")
-                conversation_history.append(("哲学者", response2))
-                
-                # 次のターンの準備
-                current_message = response2
-                await asyncio.sleep(2)
-            else:
-                print("哲学者エージェントからの応答がありません")
-                break
-        else:
-            print("研究者エージェントからの応答がありません")
+        
+        # エージェント2に研究者の応答を送信
+        print(f"\n🔬 → 哲学者エージェント: {response1}")
+        try:
+            response2 = await asyncio.wait_for(
+                send_message_to_agent(client, agent2_url, response1),
+                timeout=TURN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # 持ち時間切れ: 次のターンで研究者が同じメッセージに答える
+            print(f"\n⏱️ 哲学者エージェントが持ち時間（{TURN_TIMEOUT:g}秒）を超えたため、研究者エージェントに発言権を渡します")
+            current_message = response1
+            continue
+        
+        if not response2:
+            print("哲学者エージェントからの応答がありません")
             break
+        
+        print(f"\n🤔 哲学者エージェント: {response2}")
+        record("哲学者", response2, turn + 1)
+        
+        # 次のターンの準備
+        current_message = response2
+        await asyncio.sleep(2)
+    
+    # 書き出し待ちの発言をすべて保存してからライターを停止
+    await writer_queue.join()
+    writer_task.cancel()
     
     # 会話のまとめ
     print("\n\n" + "=" * 70)
     print("📝 会話のまとめ")
     print("=" * 70)
-    for i, (agent, message) in enumerate(conversation_history):
-        print(f"\n{i+1}. {agent}: {message[:100]}...")
+    first_index = message_count - len(conversation_history) + 1
+    for i, (agent, message) in enumerate(conversation_history, start=first_index):
+        print(f"\n{i}. {agent}: {message[:100]}...")
+    print(f"\n💾 全発言ログ: {log_path}")
 
 
-async def check_agents_health():
+async def check_agents_health(client: httpx.AsyncClient):
     """エージェントのヘルスチェック"""
     agents = [
         ("研究者エージェント", "http://localhost:9001/health"),
@@ -114,19 +164,22 @@ async def check_agents_health():
     print("\n🏥 エージェントのヘルスチェック...")
     all_healthy = True
     
-    async with httpx.AsyncClient() as client:
-        for name, url in agents:
-            try:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"✅ {name}: {data['status']} (役割: {data['role']})")
-                else:
-                    print(f"❌ {name}: 応答なし")
-                    all_healthy = False
-            except Exception as e:
-                print(f"❌ {name}: 接続エラー - {str(e)}")
-                all_healthy = False
+    # 全エージェントへ同時に問い合わせ（待ち時間は合計ではなく最大値になる）
+    responses = await asyncio.gather(
+        *(client.get(url) for _, url in agents),
+        return_exceptions=True
+    )
+    
+    for (name, _), response in zip(agents, responses):
+        if isinstance(response, Exception):
+            print(f"❌ {name}: 接続エラー - {str(response)}")
+            all_healthy = False
+        elif response.status_code == 200:
+            data = orjson.loads(response.content)
+            print(f"✅ {name}: {data['status']} (役割: {data['role']})")
+        else:
+            print(f"❌ {name}: 応答なし")
+            all_healthy = False
     
     return all_healthy
 
@@ -140,16 +193,25 @@ async def main():
     print("   - ターミナル1: python ai_agent_server.py 研究者エージェント '技術的な観点から分析する研究者' 9001")
     print("   - ターミナル2: python ai_agent_server.py 哲学者エージェント '哲学的な観点から考察する思想家' 9002")
     
-    # ヘルスチェック
-    if await check_agents_health():
-        print("\n✅ すべてのエージェントが正常に動作しています")
-        print("\n3秒後に会話を開始します...")
-        await asyncio.sleep(3)
-        
-        # AI同士の会話デモ
-        await ai_conversation_demo()
-    else:
-        print("\n❌ エージェントが起動していません。上記の手順でエージェントを起動してください。")
+    # 全リクエストで1つのクライアント（コネクションプール）を使い回す
+    # 実行中のイベントループ内で作成し、終了時に必ず閉じる
+    client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30)
+    )
+    try:
+        # ヘルスチェック
+        if await check_agents_health(client):
+            print("\n✅ すべてのエージェントが正常に動作しています")
+            print("\n3秒後に会話を開始します...")
+            await asyncio.sleep(3)
+            
+            # AI同士の会話デモ
+            await ai_conversation_demo(client)
+        else:
+            print("\n❌ エージェントが起動していません。上記の手順でエージェントを起動してください。")
+    finally:
+        await client.aclose()
 
 
 if __name__ == "__main__":
@@ -5,15 +5,55 @@ Checkpoint Manager - Session State Persistence
 Manages checkpoints for debate sessions based on Luna's design.
 """
 
-import json
+import atexit
+import logging
 import os
-from typing import Dict, Any, Optional, List
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 import uuid
 from enum import Enum
 
-from .session_manager import DebateSession, SessionStatus, DiscussionTurn
+import orjson
+
+from .session_manager import AgentStats, DebateSession, SessionStatus
+
+
+CHECKPOINT_SUBDIRS = ['automatic', 'manual', 'scheduled', 'emergency']
+
+def _encode_default(obj: Any) -> Any:
+    """orjson fallback: datetimes as isoformat(), matching to_dict/from_dict"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# File extension per on-disk format ("msgpack" requires the msgpack package)
+CHECKPOINT_EXTENSIONS = {'json': '.json', 'msgpack': '.msgpack'}
+
+# Optional zstd compression (requires the zstandard package); payloads below
+# the threshold are written uncompressed since framing overhead outweighs the gain
+ZSTD_SUFFIX = '.zst'
+ZSTD_MIN_BYTES = 4096
+
+# Background flusher batching (batch_writes=True)
+FLUSH_INTERVAL = 0.01  # seconds
+FLUSH_MAX_BATCH = 100
+
+# fsync each checkpoint file and its directory so saves survive power loss;
+# off by default since the atomic rename already rules out torn files
+CHECKPOINT_FSYNC = os.getenv("A2A_CHECKPOINT_FSYNC") == "1"
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE_SUFFIXES = tuple(
+    ext + zst for ext in CHECKPOINT_EXTENSIONS.values() for zst in ('', ZSTD_SUFFIX)
+)
 
 
 class CheckpointType(Enum):
@@ -70,18 +110,28 @@ class SessionCheckpoint:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['checkpoint_type'] = self.checkpoint_type.value
-        data['status'] = self.status.value
-        
-        # Convert agent states
-        data['participants_state'] = {
-            agent_id: asdict(state) 
-            for agent_id, state in self.participants_state.items()
+        # Built field by field; asdict() would deep-copy every response text
+        return {
+            'checkpoint_id': self.checkpoint_id,
+            'session_id': self.session_id,
+            'timestamp': self.timestamp.isoformat(),
+            'turn_number': self.turn_number,
+            'checkpoint_type': self.checkpoint_type.value,
+            'status': self.status.value,
+            'participants_state': {
+                agent_id: {
+                    'agent_id': state.agent_id,
+                    'last_response': state.last_response,
+                    'response_time': state.response_time,
+                    'turn_count': state.turn_count,
+                    'personality_params': state.personality_params,
+                    'conversation_summary': state.conversation_summary
+                }
+                for agent_id, state in self.participants_state.items()
+            },
+            'quality_snapshot': self.quality_snapshot,
+            'metadata': self.metadata
         }
-        
-        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionCheckpoint':
@@ -105,10 +155,44 @@ class SessionCheckpoint:
 class CheckpointManager:
     """Manages session checkpoints for recovery and analysis"""
     
-    def __init__(self, checkpoint_dir: str = "discussions/checkpoints"):
+    def __init__(
+        self,
+        checkpoint_dir: str = "discussions/checkpoints",
+        checkpoint_format: str = "json",
+        compress: bool = False,
+        batch_writes: bool = False
+    ):
+        if checkpoint_format not in CHECKPOINT_EXTENSIONS:
+            raise ValueError(f"Unknown checkpoint format: {checkpoint_format}")
+        
         self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_format = checkpoint_format
+        self.compress = compress
         self._ensure_directory()
         
+        # session_id -> [(subdir, filepath)], so lookups skip directory scans
+        self._index: Dict[str, List[Tuple[str, str]]] = {}
+        self._build_index()
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        
+        # filepath -> (mtime_ns, checkpoint), LRU-ordered; the mtime check
+        # makes a rewritten file miss instead of returning stale data
+        self.cache_size = 128
+        self._cache: "OrderedDict[str, Tuple[int, SessionCheckpoint]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Last checkpoint written per live session, reused by the emergency path
+        # (dropped once the session completes or errors, so it stays bounded)
+        self._last_saved: Dict[str, SessionCheckpoint] = {}
+        
+        # Optional background flusher: save_checkpoint only enqueues, and writes
+        # are batched so turn processing does not wait on disk
+        self._pending: Optional["queue.Queue[SessionCheckpoint]"] = None
+        if batch_writes:
+            self._pending = queue.Queue()
+            threading.Thread(target=self._flush_loop, name="checkpoint-flusher", daemon=True).start()
+            atexit.register(self.flush)
+        
         # Configuration
         self.auto_checkpoint_enabled = True
         self.checkpoint_every_n_turns = 1  # Every turn by default
@@ -119,9 +203,60 @@ class CheckpointManager:
         os.makedirs(self.checkpoint_dir, exist_ok=True)
         
         # Create subdirectories for organization
-        for subdir in ['automatic', 'manual', 'scheduled', 'emergency']:
+        for subdir in CHECKPOINT_SUBDIRS:
             os.makedirs(os.path.join(self.checkpoint_dir, subdir), exist_ok=True)
     
+    def _build_index(self):
+        """Scan checkpoint directories once and index files by session id"""
+        self._index.clear()
+        for subdir in CHECKPOINT_SUBDIRS:
+            dir_path = os.path.join(self.checkpoint_dir, subdir)
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(CHECKPOINT_FILE_SUFFIXES):
+                        continue
+                    # Both "{sid}_{cid}.json" and "{sid}__{ts}__{cid}.json" start with "{sid}_"
+                    session_id = entry.name.split('_', 1)[0]
+                    self._index.setdefault(session_id, []).append((subdir, entry.path))
+    
+    def _read_checkpoint(self, filepath: str) -> SessionCheckpoint:
+        """Read a checkpoint file, reusing the parsed result while the file is unchanged"""
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        with self._cache_lock:
+            cached = self._cache.get(filepath)
+            if cached is not None and cached[0] == mtime_ns:
+                self._cache.move_to_end(filepath)
+                return cached[1]
+        
+        checkpoint = self._read_checkpoint_file(filepath)
+        
+        with self._cache_lock:
+            self._cache[filepath] = (mtime_ns, checkpoint)
+            self._cache.move_to_end(filepath)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return checkpoint
+    
+    @staticmethod
+    def _read_checkpoint_file(filepath: str) -> SessionCheckpoint:
+        """Read and parse a single checkpoint file"""
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        
+        if filepath.endswith(ZSTD_SUFFIX):
+            import zstandard
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+            filepath = filepath[:-len(ZSTD_SUFFIX)]
+        
+        if filepath.endswith('.msgpack'):
+            import msgpack
+            data = msgpack.unpackb(raw)
+        else:
+            data = orjson.loads(raw)
+        
+        return SessionCheckpoint.from_dict(data)
+    
     def create_checkpoint(
         self,
         session: DebateSession,
@@ -131,46 +266,28 @@ class CheckpointManager:
     ) -> SessionCheckpoint:
         """Create a new checkpoint from current session state"""
         
-        # Extract participant states
-        participants_state = {}
-        
-        # Group turns by agent
-        agent_turns = {}
-        for turn in session.turn_history:
-            if turn.agent_id not in agent_turns:
-                agent_turns[turn.agent_id] = []
-            agent_turns[turn.agent_id].append(turn)
+        # Per-agent statistics are maintained incrementally as turns are recorded;
+        # rebuild only if turn_history was modified directly
+        if sum(stats.turn_count for stats in session.agent_stats.values()) != len(session.turn_history):
+            session.rebuild_agent_stats()
         
         # Create agent states
+        participants_state = {}
         for participant in session.participants:
             agent_id = participant['id']
-            agent_name = participant['name']
+            stats = session.agent_stats.get(agent_id, AgentStats())
             
-            # Get agent's turns
-            turns = agent_turns.get(agent_id, [])
-            
-            if turns:
-                last_turn = turns[-1]
-                last_response = last_turn.message
-                last_response_time = last_turn.response_time
-            else:
-                last_response = ""
-                last_response_time = 0.0
-            
-            # Create agent state
-            agent_state = AgentState(
+            participants_state[agent_id] = AgentState(
                 agent_id=agent_id,
-                last_response=last_response,
-                response_time=last_response_time,
-                turn_count=len(turns),
+                last_response=stats.last_message,
+                response_time=stats.last_response_time,
+                turn_count=stats.turn_count,
                 personality_params={
-                    "name": agent_name,
+                    "name": participant['name'],
                     "role": participant.get('role', 'unknown')
                 },
-                conversation_summary=self._generate_summary(turns)
+                conversation_summary=self._generate_summary(stats)
             )
-            
-            participants_state[agent_id] = agent_state
         
         # Create checkpoint
         checkpoint = SessionCheckpoint(
@@ -195,32 +312,127 @@ class CheckpointManager:
         return checkpoint
     
     def save_checkpoint(self, checkpoint: SessionCheckpoint):
-        """Save checkpoint to disk"""
+        """Save checkpoint to disk (queued for the background flusher if batching)"""
+        if checkpoint.status in (SessionStatus.COMPLETED, SessionStatus.ERROR):
+            self._last_saved.pop(checkpoint.session_id, None)
+        else:
+            self._last_saved[checkpoint.session_id] = checkpoint
+        
+        if self._pending is not None:
+            self._pending.put(checkpoint)
+            return
+        
+        self._write_checkpoints([checkpoint])
+    
+    def _serialize_checkpoint(self, checkpoint: SessionCheckpoint) -> Tuple[str, str, bytes]:
+        """Encode a checkpoint and pick its (subdir, filepath)"""
         # Determine subdirectory based on type
         subdir = checkpoint.checkpoint_type.value
         
-        # Create filename
-        filename = f"{checkpoint.session_id}_{checkpoint.checkpoint_id}.json"
-        filepath = os.path.join(self.checkpoint_dir, subdir, filename)
+        # Create filename (timestamp in the name keeps directory order chronological)
+        timestamp = checkpoint.timestamp.strftime('%Y%m%dT%H%M%S%f')
+        extension = CHECKPOINT_EXTENSIONS[self.checkpoint_format]
         
-        # Save as JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint.to_dict(), f, indent=2, ensure_ascii=False)
+        if self.checkpoint_format == 'msgpack':
+            import msgpack
+            payload = msgpack.packb(checkpoint.to_dict())
+        else:
+            # orjson walks the dataclasses (and enums) directly, so no intermediate
+            # dict is built; it writes UTF-8 without escaping Japanese text.
+            # Indentation is only worth it for files meant to be read as-is.
+            option = orjson.OPT_PASSTHROUGH_DATETIME
+            if not self.compress:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(checkpoint, default=_encode_default, option=option)
+        
+        if self.compress and len(payload) >= ZSTD_MIN_BYTES:
+            import zstandard
+            payload = zstandard.ZstdCompressor(level=3).compress(payload)
+            extension += ZSTD_SUFFIX
+        
+        filename = f"{checkpoint.session_id}__{timestamp}__{checkpoint.checkpoint_id}{extension}"
+        return subdir, os.path.join(self.checkpoint_dir, subdir, filename), payload
+    
+    def _write_checkpoints(self, checkpoints: List[SessionCheckpoint]):
+        """Write checkpoints atomically (and durably when CHECKPOINT_FSYNC is set)"""
+        written = []
+        
+        # Write to temp files and rename, so a crash never leaves a truncated checkpoint
+        for checkpoint in checkpoints:
+            subdir, filepath, payload = self._serialize_checkpoint(checkpoint)
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                if CHECKPOINT_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            written.append((checkpoint.session_id, subdir, filepath))
+        
+        # Persist the renames with one fsync per directory for the whole batch
+        if CHECKPOINT_FSYNC:
+            for subdir in {subdir for _, subdir, _ in written}:
+                dir_fd = os.open(os.path.join(self.checkpoint_dir, subdir), os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+        
+        with self._cache_lock:
+            for _, _, filepath in written:
+                self._cache.pop(filepath, None)
+        for session_id, subdir, filepath in written:
+            self._index.setdefault(session_id, []).append((subdir, filepath))
+    
+    def _flush_loop(self):
+        """Background writer: gather up to FLUSH_MAX_BATCH checkpoints per FLUSH_INTERVAL"""
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < FLUSH_MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_checkpoints(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} checkpoint(s): {str(e)}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+    
+    def flush(self):
+        """Block until every queued checkpoint has been written"""
+        if self._pending is not None:
+            self._pending.join()
+    
+    def close(self):
+        """Flush queued checkpoints and shut down the read pool"""
+        self.flush()
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
     
     def load_checkpoint(self, checkpoint_id: str) -> Optional[SessionCheckpoint]:
         """Load checkpoint by ID"""
+        self.flush()
+        
+        # File stems end with "_{checkpoint_id}" in both naming schemes
+        suffix = f"_{checkpoint_id}"
+        
         # Search in all subdirectories
-        for subdir in ['automatic', 'manual', 'scheduled', 'emergency']:
+        for subdir in CHECKPOINT_SUBDIRS:
             dir_path = os.path.join(self.checkpoint_dir, subdir)
             
-            for filename in os.listdir(dir_path):
-                if checkpoint_id in filename:
-                    filepath = os.path.join(dir_path, filename)
-                    
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    return SessionCheckpoint.from_dict(data)
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name.split('.', 1)[0].endswith(suffix):
+                        return self._read_checkpoint(entry.path)
         
         return None
     
@@ -230,26 +442,25 @@ class CheckpointManager:
         checkpoint_type: Optional[CheckpointType] = None
     ) -> List[SessionCheckpoint]:
         """Get all checkpoints for a session"""
-        checkpoints = []
+        self.flush()
         
-        # Determine which directories to search
+        if session_id not in self._index:
+            # Files may have been written by another process since the last scan
+            self._build_index()
+        
+        entries = self._index.get(session_id, [])
         if checkpoint_type:
-            subdirs = [checkpoint_type.value]
+            entries = [e for e in entries if e[0] == checkpoint_type.value]
+        paths = [filepath for _, filepath in entries]
+        
+        # Overlap file reads instead of opening them one after another
+        if len(paths) > 1:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="checkpoint-io")
+                atexit.register(self.close)
+            checkpoints = list(self._io_pool.map(self._read_checkpoint, paths))
         else:
-            subdirs = ['automatic', 'manual', 'scheduled', 'emergency']
-        
-        for subdir in subdirs:
-            dir_path = os.path.join(self.checkpoint_dir, subdir)
-            
-            for filename in os.listdir(dir_path):
-                if session_id in filename:
-                    filepath = os.path.join(dir_path, filename)
-                    
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    checkpoint = SessionCheckpoint.from_dict(data)
-                    checkpoints.append(checkpoint)
+            checkpoints = [self._read_checkpoint(p) for p in paths]
         
         # Sort by timestamp
         checkpoints.sort(key=lambda c: c.timestamp)
@@ -289,47 +500,74 @@ class CheckpointManager:
             "emergency_save": True
         }
         
+        # Fast path: if the session has not moved since the last checkpoint, reuse
+        # its (already validated) participant states instead of rebuilding them
+        last = self._last_saved.get(session.session_id)
+        if last is not None and last.turn_number == session.current_turn and last.status == session.status:
+            checkpoint = replace(
+                last,
+                checkpoint_id=str(uuid.uuid4()),
+                timestamp=datetime.now(),
+                checkpoint_type=CheckpointType.EMERGENCY,
+                quality_snapshot=None,
+                metadata=metadata
+            )
+            self.save_checkpoint(checkpoint)
+            # Emergency saves are written through even when batching
+            self.flush()
+            return checkpoint
+        
         checkpoint = self.create_checkpoint(
             session=session,
             checkpoint_type=CheckpointType.EMERGENCY,
             metadata=metadata
         )
+        self.flush()
         
         return checkpoint
     
-    def _generate_summary(self, turns: List[DiscussionTurn]) -> str:
+    def _generate_summary(self, stats: AgentStats) -> str:
         """Generate brief summary of agent's conversation"""
-        if not turns:
+        if not stats.turn_count:
             return "No conversation yet"
         
         # Simple summary: first and last key points
-        if len(turns) == 1:
+        if stats.turn_count == 1:
             # Extract first 100 chars
-            return turns[0].message[:100] + "..."
+            return stats.first_message[:100] + "..."
         else:
-            first_point = turns[0].message[:50]
-            last_point = turns[-1].message[:50]
+            first_point = stats.first_message[:50]
+            last_point = stats.last_message[:50]
             return f"Started: {first_point}... Latest: {last_point}..."
     
     def cleanup_old_checkpoints(self, days_to_keep: int = 7):
         """Remove old checkpoints to save space"""
-        import time
+        self.flush()
         
         current_time = time.time()
         cutoff_time = current_time - (days_to_keep * 24 * 60 * 60)
         
-        removed_count = 0
+        removed = set()
         
-        for subdir in ['automatic', 'manual', 'scheduled', 'emergency']:
+        for subdir in CHECKPOINT_SUBDIRS:
             dir_path = os.path.join(self.checkpoint_dir, subdir)
             
-            for filename in os.listdir(dir_path):
-                filepath = os.path.join(dir_path, filename)
-                
-                # Check file age
-                file_time = os.path.getmtime(filepath)
-                if file_time < cutoff_time:
-                    os.remove(filepath)
-                    removed_count += 1
-        
-        return removed_count
\ No newline at end of file
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    # Check file age
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.remove(entry.path)
+                        removed.add(entry.path)
+        
+        if removed:
+            with self._cache_lock:
+                for filepath in removed:
+                    self._cache.pop(filepath, None)
+            for session_id, entries in list(self._index.items()):
+                kept = [e for e in entries if e[1] not in removed]
+                if kept:
+                    self._index[session_id] = kept
+                else:
+                    del self._index[session_id]
+        
+        return len(removed)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Console Helpers - Demo Output Utilities
+=======================================
+
+Shared console output helpers for the demo scripts.
+"""
+
+import io
+import os
+import sys
+from contextlib import contextmanager
+
+
+# Response previews are for someone watching a terminal; redirected runs
+# (CI, log files) skip them unless DEMO_VERBOSE=1
+SHOW_PREVIEWS = sys.stdout.isatty() or os.getenv("DEMO_VERBOSE") == "1"
+
+
+@contextmanager
+def buffered_stdout():
+    """Collect prints in memory and write them to stdout in a single call
+    
+    sys.stdout is swapped for the whole block, so keep awaits out of it;
+    other tasks printing meanwhile would land in this buffer.
+    """
+    buffer = io.StringIO()
+    real_stdout = sys.stdout
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = real_stdout
+        real_stdout.write(buffer.getvalue())
+        real_stdout.flush()
@@ -0,0 +1,102 @@
+"""
+Debate Loop - Shared Turn Driver
+================================
+
+Runs a debate session turn by turn: agents alternate according to a turn
+plan, each response is recorded through the SessionManager, and callers
+hook in their own output, metrics or checkpointing.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Sequence, Tuple
+
+from .session_manager import DebateSession, DiscussionTurn, SessionManager
+
+if TYPE_CHECKING:
+    from agents.base_agent import BaseDebateAgent
+
+logger = logging.getLogger(__name__)
+
+
+async def run_debate(
+    turn_plan: Sequence[Tuple["BaseDebateAgent", str]],
+    session_manager: SessionManager,
+    session: DebateSession,
+    topic: str,
+    *,
+    context: str = "",
+    response_time: Optional[float] = None,
+    pace_seconds: float = 0.0,
+    on_turn_start: Optional[Callable[[int, "BaseDebateAgent", str], None]] = None,
+    on_response: Optional[Callable[[int, "BaseDebateAgent", str], Awaitable[None]]] = None,
+    on_turn: Optional[Callable[[int, DiscussionTurn], Awaitable[None]]] = None,
+    on_error: Optional[Callable[[int, Exception], Awaitable[None]]] = None
+) -> None:
+    """Drive a debate through turn_plan, one (agent, role label) pair per turn
+    
+    Args:
+        turn_plan: Speaking order; each agent answers the previous response
+        session_manager: Manager the turns are recorded with
+        session: Session created by session_manager for this debate
+        topic: Debate topic passed to every agent
+        context: Extra context passed to every agent
+        response_time: Fixed response time to record; None records the
+            agent's measured time
+        pace_seconds: Optional pause between turns
+        on_turn_start: Called before an agent starts generating
+        on_response: Awaited with each response before it is recorded
+        on_turn: Awaited with each turn once it is recorded
+        on_error: Awaited with a failed turn's exception; without it the
+            exception propagates and ends the debate
+    """
+    current_message = ""
+    last_turn = len(turn_plan) - 1
+    
+    for turn, (agent, role) in enumerate(turn_plan):
+        turn_number = turn + 1
+        
+        if on_turn_start:
+            on_turn_start(turn_number, agent, role)
+        
+        try:
+            response = await agent.generate_response(
+                topic=topic,
+                opponent_message=current_message,
+                context=context,
+                turn_number=turn_number
+            )
+            
+            if on_response:
+                await on_response(turn_number, agent, response)
+            
+            success = session_manager.add_turn(
+                session_id=session.session_id,
+                agent_id=agent.agent_id,
+                agent_name=agent.name,
+                message=response,
+                response_time=(
+                    agent.conversation_history[-1]['response_time']
+                    if response_time is None else response_time
+                )
+            )
+            
+            if success:
+                # add_turn appends to this same session object, including the
+                # final turn that completes (and deactivates) the session
+                if on_turn:
+                    await on_turn(turn_number, session.turn_history[-1])
+                
+                # Update current message for next agent
+                current_message = response
+            else:
+                logger.warning("Failed to add turn %d to session %s", turn_number, session.session_id)
+        
+        except Exception as e:
+            if not on_error:
+                raise
+            await on_error(turn_number, e)
+        
+        # Optional pause between turns
+        if turn < last_turn and pace_seconds > 0:
+            await asyncio.sleep(pace_seconds)
@@ -5,11 +5,16 @@ Error Handler - Robust Error Management with Retry Logic
 Provides comprehensive error handling and retry mechanisms for the A2A system.
 """
 
+import asyncio
+import atexit
+import copy
 import time
 import logging
+import logging.handlers
+import queue
+import random
 from typing import Callable, Any, Optional, Dict
-from functools import wraps
-import traceback
+from functools import lru_cache, wraps
 from datetime import datetime
 
 # Configure logging
@@ -52,7 +57,6 @@ def calculate_backoff_delay(attempt: int, config: RetryConfig) -> float:
     
     if config.jitter:
         # Add jitter to prevent thundering herd
-        import random
         delay = delay * (0.5 + random.random() * 0.5)
     
     return delay
@@ -68,6 +72,9 @@ def retry_with_backoff(
     """
     Decorator for retrying functions with exponential backoff
     
+    Coroutine functions are wrapped with aretry_with_backoff instead, so
+    backoff never blocks the event loop with time.sleep.
+    
     Args:
         func: Function to retry
         config: Retry configuration
@@ -78,38 +85,37 @@ def retry_with_backoff(
         config = RetryConfig()
     
     def decorator(f: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(f):
+            return aretry_with_backoff(config=config, exceptions=exceptions, on_retry=on_retry)(f)
+        
+        # Resolved once per decorated function rather than on every call
+        max_attempts = config.max_attempts
+        name = f.__name__
+        
         @wraps(f)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-            
-            for attempt in range(1, config.max_attempts + 1):
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return f(*args, **kwargs)
                     
                 except exceptions as e:
-                    last_exception = e
-                    
-                    # Log the error
-                    logger.warning(
-                        f"Attempt {attempt}/{config.max_attempts} failed for {f.__name__}: {str(e)}"
-                    )
+                    # Log the error (%-style args are only formatted if the record is emitted)
+                    logger.warning("Attempt %d/%d failed for %s: %s", attempt, max_attempts, name, e)
                     
                     # Call retry callback if provided
                     if on_retry:
                         on_retry(e, attempt)
                     
                     # If this was the last attempt, raise
-                    if attempt == config.max_attempts:
-                        logger.error(
-                            f"All {config.max_attempts} attempts failed for {f.__name__}"
-                        )
+                    if attempt == max_attempts:
+                        logger.error("All %d attempts failed for %s", max_attempts, name)
                         raise RetryError(
-                            f"Failed after {config.max_attempts} attempts: {str(last_exception)}"
-                        ) from last_exception
+                            f"Failed after {max_attempts} attempts: {str(e)}"
+                        ) from e
                     
                     # Calculate and apply backoff delay
                     delay = calculate_backoff_delay(attempt, config)
-                    logger.info(f"Retrying in {delay:.2f} seconds...")
+                    logger.info("Retrying in %.2f seconds...", delay)
                     time.sleep(delay)
             
             # Should never reach here
@@ -124,6 +130,106 @@ def retry_with_backoff(
         return decorator(func)
 
 
+def aretry_with_backoff(
+    func: Optional[Callable] = None,
+    *,
+    config: Optional[RetryConfig] = None,
+    exceptions: tuple = (Exception,),
+    on_retry: Optional[Callable[[Exception, int], None]] = None
+):
+    """
+    Async counterpart of retry_with_backoff for coroutine functions
+    
+    Backoff delays use asyncio.sleep, so other tasks on the event loop
+    keep running while a call is waiting to be retried.
+    
+    Args:
+        func: Coroutine function to retry
+        config: Retry configuration
+        exceptions: Tuple of exceptions to catch and retry
+        on_retry: Callback function called on each retry
+    """
+    if config is None:
+        config = RetryConfig()
+    
+    def decorator(f: Callable) -> Callable:
+        # Resolved once per decorated function rather than on every call
+        max_attempts = config.max_attempts
+        name = f.__name__
+        
+        @wraps(f)
+        async def wrapper(*args, **kwargs) -> Any:
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await f(*args, **kwargs)
+                    
+                except exceptions as e:
+                    # Log the error (%-style args are only formatted if the record is emitted)
+                    logger.warning("Attempt %d/%d failed for %s: %s", attempt, max_attempts, name, e)
+                    
+                    # Call retry callback if provided
+                    if on_retry:
+                        on_retry(e, attempt)
+                    
+                    # If this was the last attempt, raise
+                    if attempt == max_attempts:
+                        logger.error("All %d attempts failed for %s", max_attempts, name)
+                        raise RetryError(
+                            f"Failed after {max_attempts} attempts: {str(e)}"
+                        ) from e
+                    
+                    # Calculate and apply backoff delay without blocking the loop
+                    delay = calculate_backoff_delay(attempt, config)
+                    logger.info("Retrying in %.2f seconds...", delay)
+                    await asyncio.sleep(delay)
+            
+            # Should never reach here
+            raise RetryError("Unexpected retry loop exit")
+        
+        return wrapper
+    
+    # Handle both @aretry_with_backoff and @aretry_with_backoff() syntax
+    if func is None:
+        return decorator
+    else:
+        return decorator(func)
+
+
+# User-facing messages, checked in order; built once instead of per error
+_USER_MESSAGES = (
+    (TimeoutError, "リクエストがタイムアウトしました。しばらく待ってから再試行してください。"),
+    (ConnectionError, "接続エラーが発生しました。ネットワーク接続を確認してください。"),
+    (ValueError, "入力値にエラーがあります。入力内容を確認してください。"),
+    (RetryError, "複数回の試行後も処理が失敗しました。システム管理者にお問い合わせください。")
+)
+_USER_MESSAGE_TYPES = tuple(error_type for error_type, _ in _USER_MESSAGES)
+_DEFAULT_USER_MESSAGE = "予期しないエラーが発生しました。詳細はログを確認してください。"
+
+
+@lru_cache(maxsize=None)
+def _user_message_for(error_type: type) -> str:
+    """Resolve the user message for an exception type (memoized per type)"""
+    if not issubclass(error_type, _USER_MESSAGE_TYPES):
+        return _DEFAULT_USER_MESSAGE
+    
+    for message_type, message in _USER_MESSAGES:
+        if issubclass(error_type, message_type):
+            return message
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that passes records through unformatted
+    
+    The queue never leaves the process, so the file handler can format the
+    record (including exc_info) itself, exactly as it did when attached
+    directly to the logger. A copy is queued because the caller's thread
+    keeps formatting the original for the propagated console output.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
 class ErrorLogger:
     """Centralized error logging with detailed tracking"""
     
@@ -140,9 +246,31 @@ class ErrorLogger:
             )
         )
         
+        # Callers only enqueue records; formatting and file writes happen
+        # on the listener's background thread
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
+        
         # Add handler to logger
         self.logger = logging.getLogger("ErrorLogger")
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(_InProcessQueueHandler(log_queue))
+    
+    def flush(self):
+        """Write out every queued record; logging continues afterwards"""
+        if self._listener is not None:
+            # stop() drains the queue and joins the writer thread
+            self._listener.stop()
+            self._listener.start()
+    
+    def close(self):
+        """Flush pending records and stop the background writer"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
     
     def log_error(
         self, 
@@ -162,8 +290,7 @@ class ErrorLogger:
             'timestamp': datetime.now().isoformat(),
             'error_type': type(error).__name__,
             'error_message': str(error),
-            'context': context or {},
-            'stack_trace': traceback.format_exc()
+            'context': context or {}
         }
         
         # Log to file
@@ -181,18 +308,7 @@ class ErrorLogger:
     
     def _generate_user_message(self, error: Exception) -> str:
         """Generate user-friendly error message"""
-        error_messages = {
-            TimeoutError: "リクエストがタイムアウトしました。しばらく待ってから再試行してください。",
-            ConnectionError: "接続エラーが発生しました。ネットワーク接続を確認してください。",
-            ValueError: "入力値にエラーがあります。入力内容を確認してください。",
-            RetryError: "複数回の試行後も処理が失敗しました。システム管理者にお問い合わせください。"
-        }
-        
-        for error_type, message in error_messages.items():
-            if isinstance(error, error_type):
-                return message
-        
-        return "予期しないエラーが発生しました。詳細はログを確認してください。"
+        return _user_message_for(type(error))
 
 
 # Global error logger instance
@@ -200,37 +316,48 @@ error_logger = ErrorLogger()
 
 
 def handle_api_timeout(func: Callable) -> Callable:
-    """Specific handler for API timeout scenarios"""
+    """Specific handler for API timeout scenarios (sync or coroutine functions)"""
+    
+    # Set custom timeout config for API calls
+    api_config = RetryConfig(
+        max_attempts=3,
+        initial_delay=2.0,
+        max_delay=30.0
+    )
+    
+    # Apply retry logic (retry_with_backoff picks the async variant for coroutines)
+    api_call = retry_with_backoff(
+        func,
+        config=api_config,
+        exceptions=(TimeoutError, ConnectionError),
+        on_retry=lambda e, attempt: logger.info(
+            f"API call retry {attempt} due to: {str(e)}"
+        )
+    )
+    
+    def on_failure(e: RetryError, args: tuple, kwargs: dict) -> str:
+        # Log and return user-friendly message
+        return error_logger.log_error(
+            e,
+            context={'function': func.__name__, 'args': args, 'kwargs': kwargs},
+            user_message="API呼び出しが失敗しました。しばらく待ってから再試行してください。"
+        )
+    
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await api_call(*args, **kwargs)
+            except RetryError as e:
+                return on_failure(e, args, kwargs)
+        
+        return async_wrapper
     
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
-            # Set custom timeout config for API calls
-            api_config = RetryConfig(
-                max_attempts=3,
-                initial_delay=2.0,
-                max_delay=30.0
-            )
-            
-            # Apply retry logic
-            @retry_with_backoff(
-                config=api_config,
-                exceptions=(TimeoutError, ConnectionError),
-                on_retry=lambda e, attempt: logger.info(
-                    f"API call retry {attempt} due to: {str(e)}"
-                )
-            )
-            def api_call():
-                return func(*args, **kwargs)
-            
-            return api_call()
-            
+            return api_call(*args, **kwargs)
         except RetryError as e:
-            # Log and return user-friendly message
-            return error_logger.log_error(
-                e,
-                context={'function': func.__name__, 'args': args, 'kwargs': kwargs},
-                user_message="API呼び出しが失敗しました。しばらく待ってから再試行してください。"
-            )
+            return on_failure(e, args, kwargs)
     
     return wrapper
\ No newline at end of file
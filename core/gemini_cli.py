@@ -0,0 +1,97 @@
+"""
+Gemini CLI - Subprocess Runner
+==============================
+
+Runs gemini-cli.js as an asyncio subprocess and extracts the answer from
+its output. Shared by the debate agents and the A2A agent server so both
+get the same timeout, error handling and parsing.
+"""
+
+import asyncio
+import re
+import subprocess
+import time
+from typing import Mapping, Tuple
+
+
+# Gemini CLI prints debug output up to a "=== ... 検索中 ..." line; the answer
+# follows it. Matches the whole line including its newline, so removing a
+# separator leaves no blank line behind
+_SEPARATOR_RE = re.compile(r"^[^\n]*(?:===[^\n]*検索中|検索中[^\n]*===)[^\n]*(?:\n|$)", re.M)
+
+
+def extract_ai_response(output: str) -> str:
+    """Return the answer after the CLI's separator lines (whole output if absent)"""
+    parts = _SEPARATOR_RE.split(output, maxsplit=1)
+    if len(parts) == 2:
+        ai_response = _SEPARATOR_RE.sub("", parts[1]).strip()
+        if ai_response:
+            return ai_response
+    return output.strip()
+
+
+async def run_gemini_cli(
+    cli_path: str,
+    prompt: str,
+    env: Mapping[str, str],
+    timeout: float
+) -> Tuple[str, float]:
+    """Run the Gemini CLI once and return (raw output, response time)
+
+    Raises asyncio.TimeoutError once timeout seconds pass (the process is
+    killed) and subprocess.CalledProcessError on a non-zero exit, with the
+    decoded stderr on the exception.
+    """
+    t0 = time.perf_counter()
+    # gemini-cli.js takes the prompt from argv; stdin is detached so
+    # the child never waits on (or steals) the parent's terminal
+    proc = await asyncio.create_subprocess_exec(
+        "node", cli_path, prompt,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except BaseException:
+        # Timed out or cancelled: don't leave the CLI running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    response_time = time.perf_counter() - t0
+
+    output = stdout.decode('utf-8', errors='replace')
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode,
+            ["node", cli_path],
+            output=output,
+            stderr=stderr.decode('utf-8', errors='replace')
+        )
+
+    return output, response_time
+
+
+async def warm_up_gemini_cli(cli_path: str, env: Mapping[str, str], timeout: float = 10) -> None:
+    """Start node on the CLI bundle once without running it (no model call)
+
+    `node --check` reads and parses the whole bundle, so the first real call
+    finds node and the bundle already in the OS file cache. The exit status
+    is ignored; a broken setup is reported by the real call.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "node", "--check", cli_path,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env
+    )
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
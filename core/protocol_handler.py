@@ -9,12 +9,40 @@ This is the foundation for all agent-to-agent communication.
 from typing import Dict, Any, Optional
 import asyncio
 import json
-from uuid import uuid4
+import os
+import random
 from datetime import datetime
 
+import orjson
+
 from .a2a_types import Message, Task, TaskStatus, Role
 
 
+# Task/request ids only need to be unique, not unpredictable, so skip the
+# UUID object path and draw 128 bits from a PRNG seeded once from urandom
+_rand = random.Random(os.urandom(32))
+
+
+def _mkid() -> str:
+    """Return a random 32-char hex id"""
+    return _rand.getrandbits(128).to_bytes(16, "big").hex()
+
+
+# tasks/send envelope serialized once; only id, taskId and text are spliced in
+_NUL = orjson.dumps("\0")
+_REQUEST_PARTS = orjson.dumps({
+    "id": "\0",
+    "method": "tasks/send",
+    "params": {
+        "taskId": "\0",
+        "message": {
+            "role": "user",
+            "parts": [{"text": "\0"}]
+        }
+    }
+}).split(_NUL)
+
+
 class A2AProtocolHandler:
     """Core A2A protocol communication handler"""
     
@@ -24,10 +52,10 @@ class A2AProtocolHandler:
     def create_message_request(self, message_text: str, task_id: Optional[str] = None) -> Dict[str, Any]:
         """Create a standard A2A message request"""
         if not task_id:
-            task_id = str(uuid4())
+            task_id = _mkid()
             
         return {
-            "id": str(uuid4()),
+            "id": _mkid(),
             "method": "tasks/send", 
             "params": {
                 "taskId": task_id,
@@ -38,6 +66,21 @@ class A2AProtocolHandler:
             }
         }
     
+    def create_message_request_bytes(
+        self,
+        message_text: str,
+        task_id: Optional[str] = None,
+        request_id: Optional[str] = None
+    ) -> bytes:
+        """Create the same request as create_message_request, pre-serialized to JSON bytes"""
+        prefix, mid, text_prefix, suffix = _REQUEST_PARTS
+        return b"".join((
+            prefix, orjson.dumps(request_id or _mkid()),
+            mid, orjson.dumps(task_id or _mkid()),
+            text_prefix, orjson.dumps(message_text),
+            suffix
+        ))
+    
     def parse_response(self, response: Dict[str, Any]) -> Optional[str]:
         """Parse A2A response and extract message text"""
         try:
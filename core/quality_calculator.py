@@ -7,17 +7,49 @@ Implements Luna's quality metrics design for detecting authentic AI conversation
 
 import time
 import math
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Deque, FrozenSet, Set
+from dataclasses import dataclass, field
 from datetime import datetime
-import statistics
 import re
-from collections import Counter
+from bisect import bisect_left
+from collections import Counter, deque
 
-from .session_manager import DiscussionTurn, DebateSession
+from .session_manager import DATACLASS_SLOTS, DiscussionTurn, DebateSession, SessionStatus
 
 
-@dataclass
+# Common words skipped during keyword extraction
+_STOPWORDS = frozenset({
+    'は', 'が', 'を', 'に', 'で', 'と', 'の', 'から', 'まで',
+    'the', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might'
+})
+
+# Marker characters used by the linguistic-feature translate table
+_HIRAGANA_MARK = '\x01'
+_KATAKANA_MARK = '\x02'
+_KANJI_MARK = '\x03'
+_SENTENCE_MARK = '\x04'
+
+
+def _build_char_class_table() -> Dict[int, str]:
+    """Map each character class of interest to a marker for str.translate"""
+    table = {}
+    for first, last, mark in (
+        ('ぁ', 'ん', _HIRAGANA_MARK),
+        ('ァ', 'ヴ', _KATAKANA_MARK),
+        ('一', '龯', _KANJI_MARK),
+    ):
+        for codepoint in range(ord(first), ord(last) + 1):
+            table[codepoint] = mark
+    for terminator in '。！？.!?':
+        table[ord(terminator)] = _SENTENCE_MARK
+    # Markers already present in the text must not be counted
+    for mark in (_HIRAGANA_MARK, _KATAKANA_MARK, _KANJI_MARK, _SENTENCE_MARK):
+        table[ord(mark)] = '\x00'
+    return table
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TurnMetrics:
     """Metrics for a single discussion turn"""
     turn_number: int
@@ -44,6 +76,63 @@ class QualityReport:
     timestamp: datetime
 
 
+@dataclass
+class SessionMetricsCache:
+    """Per-turn metrics and running keyword indexes for a session's history prefix
+    
+    Turns are folded in strictly increasing turn_number order, so the
+    indexes always describe exactly the history preceding the next turn.
+    The indexes live and die with the cache entry, so they follow the
+    calculator's session eviction rather than a policy of their own.
+    """
+    topic: str
+    turns: List[DiscussionTurn] = field(default_factory=list)
+    metrics: List[TurnMetrics] = field(default_factory=list)
+    turn_numbers: List[int] = field(default_factory=list)
+    # Columns of the aggregated scores, kept alongside metrics for fast reductions
+    coherence_scores: List[float] = field(default_factory=list)
+    relevance_scores: List[float] = field(default_factory=list)
+    diversity_scores: List[float] = field(default_factory=list)
+    reference_total: int = 0
+    recent_keywords: Deque[FrozenSet[str]] = field(default_factory=lambda: deque(maxlen=3))
+    agent_vocabulary: Dict[str, Set[str]] = field(default_factory=dict)
+    agent_word_totals: Dict[str, int] = field(default_factory=dict)
+    phrases: Set[str] = field(default_factory=set)
+    
+    def extends_to(self, session: DebateSession) -> bool:
+        """Whether the session's history still starts with the cached turns"""
+        if len(self.turns) > len(session.turn_history):
+            return False
+        if not self.turns:
+            return True
+        last = self.turns[-1]
+        if session.turn_history[len(self.turns) - 1] is not last:
+            return False
+        # Turns appended later must not precede cached ones, or they would
+        # belong to the history of turns already scored
+        return all(t.turn_number > last.turn_number
+                   for t in session.turn_history[len(self.turns):])
+    
+    def record(self, turn: DiscussionTurn, metrics: TurnMetrics,
+               keywords: Tuple[str, ...], phrases: FrozenSet[str]):
+        """Fold a scored turn into the cache and its running indexes"""
+        self.add_metrics(turn, metrics)
+        self.recent_keywords.append(frozenset(keywords))
+        self.agent_vocabulary.setdefault(turn.agent_id, set()).update(keywords)
+        self.agent_word_totals[turn.agent_id] = self.agent_word_totals.get(turn.agent_id, 0) + len(keywords)
+        self.phrases.update(phrases)
+    
+    def add_metrics(self, turn: DiscussionTurn, metrics: TurnMetrics):
+        """Append a turn's metrics and their aggregation columns"""
+        self.turns.append(turn)
+        self.metrics.append(metrics)
+        self.turn_numbers.append(turn.turn_number)
+        self.coherence_scores.append(metrics.coherence_score)
+        self.relevance_scores.append(metrics.relevance_score)
+        self.diversity_scores.append(metrics.diversity_score)
+        self.reference_total += metrics.reference_count
+
+
 class QualityCalculator:
     """Calculate real-time quality metrics for AI debates"""
     
@@ -55,8 +144,35 @@ class QualityCalculator:
         'fake_detection': 0.4,      # Alert if authenticity < 40%
     }
     
+    # Upper bound on memoized keyword extractions kept in word_cache
+    WORD_CACHE_SIZE = 2048
+    
+    # Upper bound on sessions kept in _metrics_cache; each entry holds a whole
+    # session's metrics and keyword indexes, so far fewer are kept than words
+    SESSION_CACHE_SIZE = 256
+    
+    # Sessions in these states never gain turns, so their caches are dropped
+    _FINISHED_STATUSES = frozenset({SessionStatus.COMPLETED, SessionStatus.ERROR})
+    
+    # Patterns compiled once instead of looked up in re's cache on every call
+    _KEYWORD_RE = re.compile(r'\w+')
+    _WORD4_RE = re.compile(r'\b\w{4,}\b')
+    _CHAR_CLASS_TABLE = _build_char_class_table()
+    # The English reference phrases can never overlap one another, so a single
+    # alternation counts exactly what separate patterns would
+    _REFERENCE_PHRASE_RE = re.compile(r'you mentioned|you said|your point about', re.IGNORECASE)
+    # Wildcard patterns, each paired with the literal it must start with
+    _WILDCARD_REFERENCE_RES = tuple((lead, re.compile(pattern, re.IGNORECASE)) for lead, pattern in (
+        ('先ほど', r'先ほど.*言った'),
+        ('前の', r'前の.*主張'),
+        ('さっき', r'さっき.*述べた'),
+    ))
+    
     def __init__(self):
         self.word_cache = {}  # Cache for performance
+        self.phrase_cache: Dict[str, FrozenSet[str]] = {}
+        self.feature_cache: Dict[str, Dict[str, float]] = {}
+        self._metrics_cache: Dict[str, SessionMetricsCache] = {}
     
     def calculate_turn_metrics(
         self, 
@@ -65,14 +181,21 @@ class QualityCalculator:
         topic: str
     ) -> TurnMetrics:
         """Calculate all metrics for a single turn"""
+        cache = self._cache_for_next_turn(turn, session, topic)
+        if cache is not None:
+            return self._score_next_turn(turn, session, topic, cache)
         
         # Get conversation history up to this turn
-        history = [t for t in session.turn_history if t.turn_number < turn.turn_number]
+        history = self._history_before(turn, session)
+        
+        # Keywords are extracted once and shared by the individual metrics
+        keywords = self._extract_keywords(turn.message)
+        topic_keywords = self._extract_keywords(topic)
         
         # Calculate individual metrics
-        coherence = self._calculate_coherence(turn, history)
-        relevance = self._calculate_relevance(turn, topic)
-        diversity = self._calculate_diversity(turn, history)
+        coherence = self._calculate_coherence(keywords, history)
+        relevance = self._calculate_relevance(keywords, topic_keywords)
+        diversity = self._calculate_diversity(turn, keywords, history)
         authenticity = self._calculate_authenticity(turn, session)
         
         # Extract linguistic features
@@ -94,7 +217,102 @@ class QualityCalculator:
             linguistic_features=linguistic_features
         )
     
-    def _calculate_coherence(self, turn: DiscussionTurn, history: List[DiscussionTurn]) -> float:
+    def _history_before(self, turn: DiscussionTurn, session: DebateSession) -> List[DiscussionTurn]:
+        """Turns numbered before turn, sliced from the cached ordered prefix when possible"""
+        cache = self._metrics_cache.get(session.session_id)
+        if cache is None or not cache.turns or not cache.extends_to(session):
+            return [t for t in session.turn_history if t.turn_number < turn.turn_number]
+        
+        # The cached prefix is strictly increasing and every later turn is
+        # numbered above it, so the cut point can be bisected
+        position = bisect_left(cache.turn_numbers, turn.turn_number)
+        if position < len(cache.turn_numbers):
+            return session.turn_history[:position]
+        tail = session.turn_history[position:]
+        return session.turn_history[:position] + [t for t in tail if t.turn_number < turn.turn_number]
+    
+    def _cache_for_next_turn(
+        self,
+        turn: DiscussionTurn,
+        session: DebateSession,
+        topic: str
+    ) -> Optional[SessionMetricsCache]:
+        """Return the session cache if turn is the next one it can fold in"""
+        cache = self._metrics_cache.get(session.session_id)
+        if cache is not None and cache.topic != topic:
+            return None
+        if cache is None or not cache.extends_to(session):
+            cache = SessionMetricsCache(topic=topic)
+        
+        position = len(cache.turns)
+        history = session.turn_history
+        if position >= len(history) or history[position] is not turn:
+            return None
+        if any(t.turn_number <= turn.turn_number for t in history[position + 1:]):
+            return None
+        
+        self._store_session_cache(session, cache)
+        return cache
+    
+    def _store_session_cache(self, session: DebateSession, cache: SessionMetricsCache):
+        """Keep a session's cache as most recently used, or drop it once the session has finished"""
+        self._metrics_cache.pop(session.session_id, None)
+        if session.status in self._FINISHED_STATUSES:
+            return
+        if len(self._metrics_cache) >= self.SESSION_CACHE_SIZE:
+            # Evict the least recently used session; dicts preserve insertion order
+            del self._metrics_cache[next(iter(self._metrics_cache))]
+        self._metrics_cache[session.session_id] = cache
+    
+    def _score_next_turn(
+        self,
+        turn: DiscussionTurn,
+        session: DebateSession,
+        topic: str,
+        cache: SessionMetricsCache
+    ) -> TurnMetrics:
+        """Score a turn against the cache's running indexes instead of rescanning history"""
+        keywords = self._extract_keywords(turn.message)
+        phrases = self._extract_phrases(turn.message)
+        
+        # Context retention: overlap with the keywords of the last 3 turns
+        if not cache.turns:
+            coherence = 1.0
+        else:
+            keywords_from_history = frozenset().union(*cache.recent_keywords)
+            if keywords_from_history:
+                common_words = keywords_from_history.intersection(keywords)
+                coherence = min(len(common_words) / len(keywords_from_history) * 2, 1.0)
+            else:
+                coherence = 0.8
+        
+        # Vocabulary diversity across the agent's messages including this one
+        vocabulary = cache.agent_vocabulary.get(turn.agent_id)
+        if vocabulary is None:
+            diversity = 1.0
+        else:
+            total_words = cache.agent_word_totals[turn.agent_id] + len(keywords)
+            if total_words:
+                unique_words = len(vocabulary) + len(set(keywords).difference(vocabulary))
+                diversity = unique_words / total_words
+            else:
+                diversity = 0.5
+        
+        metrics = TurnMetrics(
+            turn_number=turn.turn_number,
+            coherence_score=coherence,
+            relevance_score=self._calculate_relevance(keywords, self._extract_keywords(topic)),
+            diversity_score=diversity,
+            authenticity_score=self._calculate_authenticity(turn, session),
+            response_time=turn.response_time,
+            reference_count=self._count_references(turn, cache.turns),
+            new_arguments=len(phrases - cache.phrases) // 3,
+            linguistic_features=self._extract_linguistic_features(turn.message)
+        )
+        cache.record(turn, metrics, keywords, phrases)
+        return metrics
+    
+    def _calculate_coherence(self, keywords: Tuple[str, ...], history: List[DiscussionTurn]) -> float:
         """Context Retention Score (CRS) - How well agent remembers previous points"""
         if not history:
             return 1.0  # First turn is always coherent
@@ -109,20 +327,16 @@ class QualityCalculator:
             keywords_from_history.update(words)
         
         # Check how many historical keywords appear in current turn
-        current_words = self._extract_keywords(turn.message)
-        common_words = keywords_from_history.intersection(current_words)
+        common_words = keywords_from_history.intersection(keywords)
         
         if keywords_from_history:
             coherence = len(common_words) / len(keywords_from_history)
             return min(coherence * 2, 1.0)  # Scale up but cap at 1.0
         return 0.8  # Default if no history keywords
     
-    def _calculate_relevance(self, turn: DiscussionTurn, topic: str) -> float:
+    def _calculate_relevance(self, turn_words: Tuple[str, ...], topic_words: Tuple[str, ...]) -> float:
         """Topic Adherence Score (TAS) - How closely response relates to topic"""
         # Simple keyword-based relevance for now
-        topic_words = self._extract_keywords(topic)
-        turn_words = self._extract_keywords(turn.message)
-        
         if not topic_words:
             return 0.5
         
@@ -132,7 +346,12 @@ class QualityCalculator:
         
         return min(relevance * 1.5, 1.0)  # Scale and cap
     
-    def _calculate_diversity(self, turn: DiscussionTurn, history: List[DiscussionTurn]) -> float:
+    def _calculate_diversity(
+        self,
+        turn: DiscussionTurn,
+        keywords: Tuple[str, ...],
+        history: List[DiscussionTurn]
+    ) -> float:
         """Response Diversity Index (RDI) - Prevents repetitive responses"""
         # Get agent's previous messages
         agent_history = [t for t in history if t.agent_id == turn.agent_id]
@@ -140,31 +359,36 @@ class QualityCalculator:
         if not agent_history:
             return 1.0  # First message is always diverse
         
-        # Calculate vocabulary diversity
-        all_words = []
-        for t in agent_history + [turn]:
-            all_words.extend(self._extract_keywords(t.message))
-        
-        if not all_words:
+        # Calculate vocabulary diversity from unique/total counters
+        vocabulary = set()
+        total_words = 0
+        for t in agent_history:
+            history_keywords = self._extract_keywords(t.message)
+            vocabulary.update(history_keywords)
+            total_words += len(history_keywords)
+        vocabulary.update(keywords)
+        total_words += len(keywords)
+        
+        if not total_words:
             return 0.5
         
-        unique_words = len(set(all_words))
-        total_words = len(all_words)
-        
-        diversity = unique_words / total_words
+        diversity = len(vocabulary) / total_words
         return diversity
     
     def _calculate_authenticity(self, turn: DiscussionTurn, session: DebateSession) -> float:
         """Response Time Variance (RTV) + Linguistic Fingerprint"""
         # Luna's brilliant idea: Check response time variance
-        response_times = [t.response_time for t in session.turn_history if t.response_time > 0]
+        stats = session.response_time_stats
+        if stats.turns_seen != len(session.turn_history):
+            # turn_history was changed without record_turn; resync
+            session.rebuild_response_time_stats()
+            stats = session.response_time_stats
         
-        if len(response_times) < 3:
+        if stats.count < 3:
             return 0.8  # Not enough data yet
         
-        # Calculate variance
-        variance = statistics.variance(response_times)
-        mean_time = statistics.mean(response_times)
+        # Running variance, O(1) per turn instead of a rescan
+        variance = stats.variance
         
         # Expected variance range (based on Luna's analysis of real data)
         expected_min = 0.3  # Below 0.3s suggests fake responses
@@ -180,37 +404,74 @@ class QualityCalculator:
             # Natural variation
             return 1.0
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract meaningful keywords from text"""
-        # Remove common words and extract key terms
-        common_words = {'は', 'が', 'を', 'に', 'で', 'と', 'の', 'から', 'まで', 
-                       'the', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
-                       'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might'}
-        
-        # Simple word extraction
-        words = re.findall(r'\w+', text.lower())
-        keywords = [w for w in words if len(w) > 2 and w not in common_words]
+    def _extract_keywords(self, text: str) -> Tuple[str, ...]:
+        """Extract meaningful keywords from text (memoized per message)"""
+        cached = self.word_cache.get(text)
+        if cached is not None:
+            return cached
+        
+        keywords = self._tokenize_keywords(text)
+        self._remember(self.word_cache, text, keywords)
+        return keywords
+    
+    def _extract_phrases(self, text: str) -> FrozenSet[str]:
+        """Extract the distinct 4+ letter words of text (memoized per message)"""
+        cached = self.phrase_cache.get(text)
+        if cached is not None:
+            return cached
+        
+        phrases = frozenset(self._WORD4_RE.findall(text.lower()))
+        self._remember(self.phrase_cache, text, phrases)
+        return phrases
+    
+    def _remember(self, cache: Dict[str, Any], text: str, value: Any):
+        """Store a per-message result, keeping the cache within WORD_CACHE_SIZE"""
+        # Keyed by the message itself: str caches its hash after first use and
+        # turns keep reusing the same message objects, so lookups don't rehash
+        if len(cache) >= self.WORD_CACHE_SIZE:
+            # Evict the oldest entry; dicts preserve insertion order
+            del cache[next(iter(cache))]
+        cache[text] = value
+    
+    def _tokenize_keywords(self, text: str) -> Tuple[str, ...]:
+        """Tokenize text into keywords, skipping stopwords and short words"""
+        # Simple word extraction, removing common words
+        words = self._KEYWORD_RE.findall(text.lower())
+        keywords = tuple([w for w in words if len(w) > 2 and w not in _STOPWORDS])
         
         return keywords
     
     def _extract_linguistic_features(self, text: str) -> Dict[str, float]:
-        """Extract linguistic fingerprint features"""
+        """Extract linguistic fingerprint features (memoized per message)"""
+        cached = self.feature_cache.get(text)
+        if cached is None:
+            cached = self._scan_linguistic_features(text)
+            self._remember(self.feature_cache, text, cached)
+        # Each TurnMetrics gets its own dict so callers can't alter the cache
+        return dict(cached)
+    
+    def _scan_linguistic_features(self, text: str) -> Dict[str, float]:
+        """Compute linguistic fingerprint features in a single translate pass"""
         features = {}
         
-        # Sentence count and average length
-        sentences = re.split(r'[。！？\.!?]', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # One C-level pass tags every character class; counts and the
+        # sentence split below then run over the tagged copy
+        tagged = text.translate(self._CHAR_CLASS_TABLE)
+        
+        # Sentence count and average length (non-tagged characters are unchanged)
+        # Each segment is stripped once; empty ones (e.g. between "!?") don't count
+        sentences = [s for s in map(str.strip, tagged.split(_SENTENCE_MARK)) if s]
         features['sentence_count'] = len(sentences)
-        features['avg_sentence_length'] = sum(len(s) for s in sentences) / max(len(sentences), 1)
+        features['avg_sentence_length'] = sum(map(len, sentences)) / max(len(sentences), 1)
         
         # Punctuation usage
         features['exclamation_ratio'] = text.count('！') / max(len(text), 1)
         features['question_ratio'] = text.count('？') / max(len(text), 1)
         
         # Character type ratios
-        hiragana = len(re.findall(r'[ぁ-ん]', text))
-        katakana = len(re.findall(r'[ァ-ヴ]', text))
-        kanji = len(re.findall(r'[一-龯]', text))
+        hiragana = tagged.count(_HIRAGANA_MARK)
+        katakana = tagged.count(_KATAKANA_MARK)
+        kanji = tagged.count(_KANJI_MARK)
         total_chars = max(len(text), 1)
         
         features['hiragana_ratio'] = hiragana / total_chars
@@ -221,33 +482,27 @@ class QualityCalculator:
     
     def _count_references(self, turn: DiscussionTurn, history: List[DiscussionTurn]) -> int:
         """Count explicit references to previous arguments"""
-        reference_patterns = [
-            r'先ほど.*言った',
-            r'前の.*主張',
-            r'さっき.*述べた',
-            r'you mentioned',
-            r'you said',
-            r'your point about'
-        ]
-        
-        count = 0
-        for pattern in reference_patterns:
-            count += len(re.findall(pattern, turn.message, re.IGNORECASE))
-        
+        # Wildcard patterns are counted separately, as overlapping matches all
+        # count; the substring check skips the regex scan for most messages
+        message = turn.message
+        count = len(self._REFERENCE_PHRASE_RE.findall(message))
+        for lead, pattern in self._WILDCARD_REFERENCE_RES:
+            if lead in message:
+                count += len(pattern.findall(message))
         return count
     
     def _count_new_arguments(self, turn: DiscussionTurn, history: List[DiscussionTurn]) -> int:
         """Count new arguments introduced"""
         # Extract key phrases from current turn
-        current_phrases = set(re.findall(r'\b\w{4,}\b', turn.message.lower()))
+        new_phrases = set(self._extract_phrases(turn.message))
         
-        # Extract phrases from history
-        historical_phrases = set()
+        # Strip phrases already used in history, stopping once none are left
         for h_turn in history:
-            historical_phrases.update(re.findall(r'\b\w{4,}\b', h_turn.message.lower()))
+            if not new_phrases:
+                break
+            new_phrases.difference_update(self._extract_phrases(h_turn.message))
         
         # New phrases indicate new arguments
-        new_phrases = current_phrases - historical_phrases
         return len(new_phrases) // 3  # Rough estimate: 3 new words = 1 new argument
     
     def calculate_session_quality(self, session: DebateSession) -> QualityReport:
@@ -264,20 +519,20 @@ class QualityCalculator:
                 timestamp=datetime.now()
             )
         
-        # Calculate metrics for all turns
-        all_metrics = []
-        for turn in session.turn_history:
-            metrics = self.calculate_turn_metrics(turn, session, session.topic)
-            all_metrics.append(metrics)
+        # Calculate metrics only for turns added since the last report
+        scored = self._session_turn_metrics(session)
+        turn_count = len(scored.metrics)
         
-        # Aggregate scores
-        coherence = statistics.mean([m.coherence_score for m in all_metrics])
-        relevance = statistics.mean([m.relevance_score for m in all_metrics])
-        diversity = statistics.mean([m.diversity_score for m in all_metrics])
-        authenticity = statistics.mean([m.authenticity_score for m in all_metrics])
+        # Aggregate scores (math.fsum reduces each column in C, correctly rounded)
+        coherence = math.fsum(scored.coherence_scores) / turn_count
+        relevance = math.fsum(scored.relevance_scores) / turn_count
+        diversity = math.fsum(scored.diversity_scores) / turn_count
+        # Authenticity depends on the whole session's timing, not on the turn,
+        # so cached per-turn values may be stale; score it once for the session
+        authenticity = self._calculate_authenticity(session.turn_history[-1], session)
         
         # Engagement combines diversity and reference patterns
-        engagement = (diversity + min(sum(m.reference_count for m in all_metrics) / len(all_metrics) * 0.2, 1.0)) / 2
+        engagement = (diversity + min(scored.reference_total / turn_count * 0.2, 1.0)) / 2
         
         # Overall score
         overall = (coherence + relevance + engagement + authenticity) / 4
@@ -313,4 +568,25 @@ class QualityCalculator:
             alerts=alerts,
             recommendations=recommendations,
             timestamp=datetime.now()
-        )
\ No newline at end of file
+        )
+    
+    def _session_turn_metrics(self, session: DebateSession) -> SessionMetricsCache:
+        """Return metrics for every turn, reusing those cached for earlier turns"""
+        cache = self._metrics_cache.get(session.session_id)
+        if cache is None or cache.topic != session.topic or not cache.extends_to(session):
+            cache = SessionMetricsCache(topic=session.topic)
+        
+        new_turns = session.turn_history[len(cache.turns):]
+        if any(a.turn_number >= b.turn_number for a, b in zip(new_turns, new_turns[1:])):
+            # Out-of-order history can't be folded incrementally; score it directly
+            self._metrics_cache.pop(session.session_id, None)
+            scored = SessionMetricsCache(topic=session.topic)
+            for turn in session.turn_history:
+                scored.add_metrics(turn, self.calculate_turn_metrics(turn, session, session.topic))
+            return scored
+        
+        for turn in new_turns:
+            self._score_next_turn(turn, session, session.topic, cache)
+        
+        self._store_session_cache(session, cache)
+        return cache
\ No newline at end of file
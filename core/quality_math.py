@@ -0,0 +1,24 @@
+"""
+Quality Math - Numeric Aggregation Helpers
+==========================================
+
+Pure-numeric summaries shared by quality reports and demos.
+"""
+
+import math
+from typing import Sequence, Tuple
+
+
+def summarize(values: Sequence[float]) -> Tuple[float, float, float, float]:
+    """Return (mean, sample variance, min, max) of a non-empty sequence
+
+    Each reduction is a single C-level pass (fsum/min/max); the variance
+    matches statistics.variance and is 0.0 for a single value.
+    """
+    count = len(values)
+    mean = math.fsum(values) / count
+    variance = (
+        math.fsum((value - mean) ** 2 for value in values) / (count - 1)
+        if count > 1 else 0.0
+    )
+    return mean, variance, min(values), max(values)
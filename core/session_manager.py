@@ -7,13 +7,21 @@ Handles state persistence, turn management, and conversation flow.
 """
 
 from typing import Dict, List, Optional, Any
-import json
+import atexit
 import os
+import sys
+from collections import defaultdict
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 
+import orjson
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SessionStatus(Enum):
     """Session status enumeration"""
@@ -24,7 +32,7 @@ class SessionStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiscussionTurn:
     """Represents one turn in a discussion"""
     turn_number: int
@@ -33,11 +41,47 @@ class DiscussionTurn:
     message: str
     timestamp: str
     response_time: float = 0.0
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class AgentStats:
+    """Running per-agent turn statistics, updated as turns are recorded"""
+    turn_count: int = 0
+    first_message: str = ""
+    last_message: str = ""
+    last_response_time: float = 0.0
     
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    def record(self, turn: DiscussionTurn):
+        """Fold one turn into the statistics"""
+        if self.turn_count == 0:
+            self.first_message = turn.message
+        self.last_message = turn.message
+        self.last_response_time = turn.response_time
+        self.turn_count += 1
+
+
+@dataclass
+class ResponseTimeStats:
+    """Running mean/variance of positive response times (Welford's algorithm)"""
+    turns_seen: int = 0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    
+    def record(self, response_time: float):
+        """Fold one turn's response time into the statistics"""
+        self.turns_seen += 1
+        if response_time > 0:
+            self.count += 1
+            delta = response_time - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (response_time - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance, matching statistics.variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
 
 
 @dataclass  
@@ -58,15 +102,84 @@ class DebateSession:
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        # Not a dataclass field, so save_session never serializes it
+        self.agent_stats: Dict[str, AgentStats] = {}
+        self.rebuild_agent_stats()
+        self.response_time_stats = ResponseTimeStats()
+        self.rebuild_response_time_stats()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization
+        
+        Built field by field; asdict() would deep-copy every turn. Turns are
+        left as DiscussionTurn objects, which orjson serializes natively.
+        """
+        return {
+            'session_id': self.session_id,
+            'topic': self.topic,
+            'participants': self.participants,
+            'status': self.status.value,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'turn_history': self.turn_history,
+            'current_turn': self.current_turn,
+            'max_turns': self.max_turns,
+            'metadata': self.metadata
+        }
+    
+    def record_turn(self, turn: DiscussionTurn):
+        """Append a turn and update the running per-agent statistics"""
+        self.turn_history.append(turn)
+        if turn.agent_id not in self.agent_stats:
+            self.agent_stats[turn.agent_id] = AgentStats()
+        self.agent_stats[turn.agent_id].record(turn)
+        self.response_time_stats.record(turn.response_time)
+    
+    def rebuild_agent_stats(self):
+        """Recompute per-agent statistics from turn_history in one pass"""
+        stats = defaultdict(AgentStats)
+        for turn in self.turn_history:
+            stats[turn.agent_id].record(turn)
+        self.agent_stats = dict(stats)
+    
+    def rebuild_response_time_stats(self):
+        """Recompute the running response-time statistics from turn_history"""
+        stats = ResponseTimeStats()
+        for turn in self.turn_history:
+            stats.record(turn.response_time)
+        self.response_time_stats = stats
+
+
+# Active sessions are stored as a header file plus an append-only turn log
+TURN_LOG_SUFFIX = ".turns.jsonl"
+
+# orjson always writes UTF-8, matching the previous ensure_ascii=False output
+SESSION_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+TURN_LOG_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
 
 class SessionManager:
     """Manages debate sessions and discussion state"""
     
-    def __init__(self, discussions_path: str = "discussions"):
+    def __init__(self, discussions_path: str = "discussions", flush_every: int = 1):
+        """
+        Args:
+            discussions_path: Root directory for session files
+            flush_every: Turns buffered per session before the turn log is
+                appended to; 1 writes every turn through immediately
+        """
         self.discussions_path = discussions_path
+        self.flush_every = max(1, flush_every)
+        self._pending_turns: Dict[str, List[DiscussionTurn]] = {}
+        # Joined once; per-session paths only append the file name
+        self._sessions_dir = os.path.join(discussions_path, "sessions")
+        self._completed_dir = os.path.join(discussions_path, "completed")
         self.active_sessions: Dict[str, DebateSession] = {}
         self._ensure_directories()
+        
+        if self.flush_every > 1:
+            # Buffered turns must not be lost when the process exits
+            atexit.register(self.flush)
     
     def _ensure_directories(self):
         """Ensure discussion directories exist"""
@@ -103,50 +216,101 @@ class SessionManager:
             
         session = self.active_sessions[session_id]
         
-        if session.status != SessionStatus.ACTIVE:
-            if session.status == SessionStatus.PENDING:
+        status_changed = False
+        if session.status is not SessionStatus.ACTIVE:
+            if session.status is SessionStatus.PENDING:
                 session.status = SessionStatus.ACTIVE
+                status_changed = True
             else:
                 return False
         
+        # One clock read serves both the turn and the session
+        now = datetime.now().isoformat()
         turn = DiscussionTurn(
             turn_number=session.current_turn + 1,
             agent_id=agent_id,
             agent_name=agent_name,
             message=message,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now,
             response_time=response_time
         )
         
-        session.turn_history.append(turn)
+        session.record_turn(turn)
         session.current_turn += 1
-        session.updated_at = datetime.now().isoformat()
+        session.updated_at = now
         
         # Check if session should be completed
         if session.current_turn >= session.max_turns:
             session.status = SessionStatus.COMPLETED
             self.complete_session(session_id)
-        
-        self.save_session(session)
+        elif status_changed:
+            self.save_session(session)
+        else:
+            # Only the new turn is written; the header is rewritten on status changes
+            self._append_turn(session, turn)
         return True
     
     def get_session(self, session_id: str) -> Optional[DebateSession]:
         """Get session by ID"""
         return self.active_sessions.get(session_id)
     
+    def _turn_log_path(self, session_id: str) -> str:
+        """Path of an active session's append-only turn log"""
+        return os.path.join(self._sessions_dir, f"{session_id}{TURN_LOG_SUFFIX}")
+    
     def save_session(self, session: DebateSession):
-        """Save session to disk"""
-        if session.status == SessionStatus.COMPLETED:
-            filepath = os.path.join(self.discussions_path, "completed", f"{session.session_id}.json")
+        """Save session to disk
+        
+        Completed sessions are written as a single JSON file. Active sessions
+        are written as a header (without turn_history) plus a rewritten turn
+        log, which add_turn then appends to.
+        """
+        if session.status is SessionStatus.COMPLETED:
+            filepath = os.path.join(self._completed_dir, f"{session.session_id}.json")
         else:
-            filepath = os.path.join(self.discussions_path, "sessions", f"{session.session_id}.json")
+            filepath = os.path.join(self._sessions_dir, f"{session.session_id}.json")
+        
+        # A full save includes any turns still buffered for the log
+        self._pending_turns.pop(session.session_id, None)
         
         # Convert to dict and handle enum serialization
-        session_dict = asdict(session)
-        session_dict['status'] = session.status.value
+        session_dict = session.to_dict()
+        
+        if session.status is not SessionStatus.COMPLETED:
+            turn_history = session_dict.pop('turn_history')
+            # Turns already in the log when the header was written
+            session_dict['logged_turns'] = len(turn_history)
+            with open(self._turn_log_path(session.session_id), 'wb') as f:
+                f.write(b"".join(
+                    orjson.dumps(turn, option=TURN_LOG_JSON_OPTIONS) + b"\n"
+                    for turn in turn_history
+                ))
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(session_dict, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(session_dict, option=SESSION_JSON_OPTIONS))
+    
+    def _append_turn(self, session: DebateSession, turn: DiscussionTurn):
+        """Queue one turn for the session's turn log, writing every flush_every turns"""
+        pending = self._pending_turns.setdefault(session.session_id, [])
+        pending.append(turn)
+        if len(pending) >= self.flush_every:
+            self._flush_session(session.session_id)
+    
+    def _flush_session(self, session_id: str):
+        """Append a session's buffered turns to its turn log in one write"""
+        pending = self._pending_turns.pop(session_id, None)
+        if not pending:
+            return
+        with open(self._turn_log_path(session_id), 'ab') as f:
+            f.write(b"".join(
+                orjson.dumps(turn, option=TURN_LOG_JSON_OPTIONS) + b"\n"
+                for turn in pending
+            ))
+    
+    def flush(self):
+        """Write all buffered turns to their session logs"""
+        for session_id in list(self._pending_turns):
+            self._flush_session(session_id)
     
     def complete_session(self, session_id: str) -> bool:
         """Complete a session and move to completed folder"""
@@ -158,9 +322,10 @@ class SessionManager:
         session.updated_at = datetime.now().isoformat()
         
         # Move from sessions to completed
-        old_path = os.path.join(self.discussions_path, "sessions", f"{session_id}.json")
-        if os.path.exists(old_path):
-            os.remove(old_path)
+        old_path = os.path.join(self._sessions_dir, f"{session_id}.json")
+        for path in (old_path, self._turn_log_path(session_id)):
+            if os.path.exists(path):
+                os.remove(path)
         
         self.save_session(session)
         
@@ -170,38 +335,67 @@ class SessionManager:
     
     def load_session(self, session_id: str) -> Optional[DebateSession]:
         """Load session from disk"""
+        self._flush_session(session_id)
+        
         # Try active sessions first
-        filepath = os.path.join(self.discussions_path, "sessions", f"{session_id}.json")
+        filepath = os.path.join(self._sessions_dir, f"{session_id}.json")
         if not os.path.exists(filepath):
             # Try completed sessions
-            filepath = os.path.join(self.discussions_path, "completed", f"{session_id}.json")
+            filepath = os.path.join(self._completed_dir, f"{session_id}.json")
         
         if not os.path.exists(filepath):
             return None
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Convert status back to enum
             data['status'] = SessionStatus(data['status'])
             
-            # Convert turn history
+            # Convert turn history (older active files embed it in the header)
             turns = []
-            for turn_data in data['turn_history']:
+            for turn_data in data.get('turn_history', []):
                 turns.append(DiscussionTurn(**turn_data))
+            
+            # Active sessions keep their turns in an append-only log
+            logged_turns = data.pop('logged_turns', 0)
+            log_path = self._turn_log_path(session_id)
+            if data['status'] != SessionStatus.COMPLETED and os.path.exists(log_path):
+                log_turns = self._read_turn_log(log_path)
+                turns.extend(log_turns)
+                appended = len(log_turns) - logged_turns
+                if appended > 0:
+                    # The header predates these turns; catch its counters up
+                    data['current_turn'] = data.get('current_turn', 0) + appended
+                    data['updated_at'] = max(data['updated_at'], log_turns[-1].timestamp)
             data['turn_history'] = turns
             
             session = DebateSession(**data)
             
-            if session.status in [SessionStatus.ACTIVE, SessionStatus.PENDING]:
+            if session.status is SessionStatus.ACTIVE or session.status is SessionStatus.PENDING:
                 self.active_sessions[session_id] = session
             
             return session
             
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (orjson.JSONDecodeError, KeyError, ValueError):
             return None
     
+    @staticmethod
+    def _read_turn_log(log_path: str) -> List[DiscussionTurn]:
+        """Read a turn log, ignoring a torn final line from an interrupted append"""
+        with open(log_path, 'rb') as f:
+            lines = [line for line in f.read().split(b"\n") if line.strip()]
+        
+        turns = []
+        for i, line in enumerate(lines):
+            try:
+                turns.append(DiscussionTurn(**orjson.loads(line)))
+            except orjson.JSONDecodeError:
+                if i != len(lines) - 1:
+                    raise
+        return turns
+    
     def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get a summary of the session"""
         session = self.get_session(session_id) or self.load_session(session_id)
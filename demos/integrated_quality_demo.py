@@ -11,6 +11,7 @@ Demonstrates the full integration of:
 """
 
 import asyncio
+import logging
 import os
 import sys
 from datetime import datetime
@@ -20,11 +21,101 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.session_manager import SessionManager
 from core.quality_calculator import QualityCalculator
+from core.quality_math import summarize
 from core.checkpoint_manager import CheckpointManager, CheckpointType
+from core.debate_loop import run_debate
+from core.console import SHOW_PREVIEWS, buffered_stdout
 from agents.specialized.debate_agent_a import DebateAgentA
 from agents.specialized.debate_agent_b import DebateAgentB
 import json
 
+logger = logging.getLogger(__name__)
+
+
+# Optional pause between turns in seconds; off unless DEMO_PACE_SECONDS is set
+PACE_SECONDS = float(os.getenv("DEMO_PACE_SECONDS", "0"))
+
+
+# Responses longer than this are truncated in the console preview
+PREVIEW_LENGTH = 200
+
+
+def _preview(text, limit=PREVIEW_LENGTH):
+    """Return text, truncated with "..." when longer than limit"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Column order of the per-turn score tuples in quality_history
+QUALITY_KEYS = ("coherence", "relevance", "diversity", "authenticity")
+
+
+async def _post_process_turn(
+    quality_calculator,
+    checkpoint_manager,
+    session,
+    turn,
+    topic,
+    turn_number,
+    agent_name,
+    response,
+    quality_history,
+    checkpoint_ids
+):
+    """Calculate quality metrics (off the event loop) and checkpoint a turn"""
+    print(f"📊 Calculating quality metrics...")
+    
+    # Calculate turn metrics
+    turn_metrics = await asyncio.to_thread(
+        quality_calculator.calculate_turn_metrics,
+        turn,
+        session,
+        topic
+    )
+    
+    # Everything below is synchronous, so the turn report goes out in one write
+    with buffered_stdout():
+        # Display metrics
+        print(f"   Coherence: {turn_metrics.coherence_score:.1%}")
+        print(f"   Relevance: {turn_metrics.relevance_score:.1%}")
+        print(f"   Diversity: {turn_metrics.diversity_score:.1%}")
+        print(f"   Authenticity: {turn_metrics.authenticity_score:.1%}")
+        print(f"   Response Time: {turn_metrics.response_time:.2f}s")
+        
+        # Record scores in the turn's slot; the checkpoint gets them as a dict
+        scores = (
+            turn_metrics.coherence_score,
+            turn_metrics.relevance_score,
+            turn_metrics.diversity_score,
+            turn_metrics.authenticity_score
+        )
+        quality_history[turn_number - 1] = scores
+        quality_snapshot = dict(zip(QUALITY_KEYS, scores))
+        
+        # Create checkpoint (only snapshots the session; the file is written by
+        # the checkpoint manager's background flusher)
+        print(f"💾 Creating checkpoint...")
+        checkpoint = checkpoint_manager.create_checkpoint(
+            session=session,
+            checkpoint_type=CheckpointType.AUTOMATIC,
+            quality_snapshot=quality_snapshot,
+            metadata={"turn": turn_number}
+        )
+        checkpoint_ids.append(checkpoint.checkpoint_id)
+        print(f"   Checkpoint saved: {checkpoint.checkpoint_id[:8]}...")
+        
+        # Check for quality alerts
+        if turn_metrics.authenticity_score < 0.4:
+            print(f"⚠️ ALERT: Low authenticity detected!")
+        if turn_metrics.coherence_score < 0.6:
+            print(f"⚠️ ALERT: Low coherence detected!")
+        
+        # Show preview of response (interactive runs only)
+        if SHOW_PREVIEWS:
+            print(f"\n💬 {agent_name}:")
+            print("-" * 60)
+            print(_preview(response))
+            print("-" * 60 + "\n")
+
 
 async def run_integrated_demo():
     """Run complete integrated demonstration"""
@@ -42,7 +133,7 @@ async def run_integrated_demo():
     # Initialize components
     session_manager = SessionManager()
     quality_calculator = QualityCalculator()
-    checkpoint_manager = CheckpointManager()
+    checkpoint_manager = CheckpointManager(batch_writes=True)
     
     print("📦 Components initialized:")
     print(f"  - Session Manager: ✅")
@@ -54,6 +145,9 @@ async def run_integrated_demo():
     pro_agent = DebateAgentA.create_philosophical("未来哲学者")
     con_agent = DebateAgentB.create_logical("現実主義者")
     
+    # Load Node.js and the CLI bundle ahead of turn 1 so their cold start is not timed
+    await asyncio.gather(pro_agent.warm_up(), con_agent.warm_up())
+    
     # Create session
     participants = [
         {"id": pro_agent.agent_id, "name": pro_agent.name, "role": "pro"},
@@ -72,135 +166,66 @@ async def run_integrated_demo():
     print(f"📝 Topic: {topic}")
     print(f"👥 Participants: {pro_agent.name} vs {con_agent.name}\n")
     
-    # Quality tracking
-    quality_history = []
+    # Quality tracking: one QUALITY_KEYS-ordered score tuple per turn
+    # (None for turns that failed)
+    quality_history = [None] * session.max_turns
     checkpoint_ids = []
     
-    # Run debate with quality monitoring
-    current_message = ""
-    
-    for turn in range(6):  # 6 turns total
-        turn_number = turn + 1
-        
-        # Select agent
-        if turn % 2 == 0:
-            agent = pro_agent
-            role = "主張"
-        else:
-            agent = con_agent
-            role = "反論"
-        
+    def announce_turn(turn_number, agent, role):
         print(f"--- Turn {turn_number}: {agent.name} の{role} ---")
-        print(f"🤔 {agent.name} thinking...")
-        
-        try:
-            # Generate response (with retry logic built-in)
-            response = await agent.generate_response(
-                topic=topic,
-                opponent_message=current_message,
-                turn_number=turn_number
-            )
-            
-            print(f"✅ Response generated successfully")
-            
-            # Add to session
-            success = session_manager.add_turn(
-                session_id=session.session_id,
-                agent_id=agent.agent_id,
-                agent_name=agent.name,
-                message=response,
-                response_time=agent.conversation_history[-1]['response_time']
-            )
-            
-            if success:
-                # Calculate quality metrics
-                print(f"📊 Calculating quality metrics...")
-                
-                # Get updated session
-                updated_session = session_manager.get_session(session.session_id)
-                
-                # Check if session still exists (not completed)
-                if updated_session:
-                    session = updated_session
-                    
-                    # Calculate turn metrics
-                    turn_metrics = quality_calculator.calculate_turn_metrics(
-                        session.turn_history[-1],
-                        session,
-                        topic
-                    )
-                else:
-                    # Session was completed, use last known state
-                    turn_metrics = quality_calculator.calculate_turn_metrics(
-                        session.turn_history[-1],
-                        session,
-                        topic
-                    )
-                
-                # Display metrics
-                print(f"   Coherence: {turn_metrics.coherence_score:.1%}")
-                print(f"   Relevance: {turn_metrics.relevance_score:.1%}")
-                print(f"   Diversity: {turn_metrics.diversity_score:.1%}")
-                print(f"   Authenticity: {turn_metrics.authenticity_score:.1%}")
-                print(f"   Response Time: {turn_metrics.response_time:.2f}s")
-                
-                # Create quality snapshot
-                quality_snapshot = {
-                    "coherence": turn_metrics.coherence_score,
-                    "relevance": turn_metrics.relevance_score,
-                    "diversity": turn_metrics.diversity_score,
-                    "authenticity": turn_metrics.authenticity_score
-                }
-                
-                quality_history.append(quality_snapshot)
-                
-                # Create checkpoint
-                print(f"💾 Creating checkpoint...")
-                checkpoint = checkpoint_manager.create_checkpoint(
-                    session=session,
-                    checkpoint_type=CheckpointType.AUTOMATIC,
-                    quality_snapshot=quality_snapshot,
-                    metadata={"turn": turn_number}
-                )
-                checkpoint_ids.append(checkpoint.checkpoint_id)
-                print(f"   Checkpoint saved: {checkpoint.checkpoint_id[:8]}...")
-                
-                # Check for quality alerts
-                if turn_metrics.authenticity_score < 0.4:
-                    print(f"⚠️ ALERT: Low authenticity detected!")
-                if turn_metrics.coherence_score < 0.6:
-                    print(f"⚠️ ALERT: Low coherence detected!")
-                
-                # Show preview of response
-                print(f"\n💬 {agent.name}:")
-                print("-" * 60)
-                preview = response[:200] + "..." if len(response) > 200 else response
-                print(preview)
-                print("-" * 60 + "\n")
-                
-                # Update current message
-                current_message = response
-                
-            else:
-                print(f"❌ Failed to add turn to session")
-                
-        except Exception as e:
-            print(f"❌ Error during turn {turn_number}: {str(e)}")
-            
-            # Emergency checkpoint
-            print(f"🚨 Creating emergency checkpoint...")
-            if session and hasattr(session, 'session_id'):
-                emergency_checkpoint = checkpoint_manager.save_emergency_checkpoint(
-                    session_id=session.session_id,
-                    error=e,
-                    session=session
-                )
-            if emergency_checkpoint:
-                print(f"   Emergency checkpoint created")
+        logger.info(f"🤔 {agent.name} thinking...")
+    
+    async def report_response(turn_number, agent, response):
+        print(f"✅ Response generated successfully")
+    
+    async def after_add_turn(turn_number, turn):
+        # Reported before the next turn is announced so output stays in order;
+        # the checkpoint file itself is written by the background flusher
+        await _post_process_turn(
+            quality_calculator,
+            checkpoint_manager,
+            session,
+            turn,
+            topic,
+            turn_number,
+            turn.agent_name,
+            turn.message,
+            quality_history,
+            checkpoint_ids
+        )
+    
+    async def handle_turn_error(turn_number, e):
+        print(f"❌ Error during turn {turn_number}: {str(e)}")
         
-        # Brief pause
-        if turn < 5:
-            await asyncio.sleep(2)
+        # Emergency checkpoint (written through to disk, so run off the loop)
+        print(f"🚨 Creating emergency checkpoint...")
+        emergency_checkpoint = await asyncio.to_thread(
+            checkpoint_manager.save_emergency_checkpoint,
+            session_id=session.session_id,
+            error=e,
+            session=session
+        )
+        if emergency_checkpoint:
+            print(f"   Emergency checkpoint created")
+    
+    # Speaking order: pro and con alternate, 6 turns total
+    turn_plan = [(pro_agent, "主張"), (con_agent, "反論")] * 3
+    
+    # Run debate with quality monitoring (with retry logic built into the agents)
+    await run_debate(
+        turn_plan,
+        session_manager,
+        session,
+        topic,
+        pace_seconds=PACE_SECONDS,
+        on_turn_start=announce_turn,
+        on_response=report_response,
+        on_turn=after_add_turn,
+        on_error=handle_turn_error
+    )
+    
+    # Make sure every queued checkpoint is on disk before reporting
+    await asyncio.to_thread(checkpoint_manager.flush)
     
     # Final quality report
     print("\n" + "="*80)
@@ -229,11 +254,21 @@ async def run_integrated_demo():
     print(f"\n⏱️ Response Time Analysis:")
     response_times = [t.response_time for t in session.turn_history]
     if response_times:
-        import statistics
-        print(f"  - Average: {statistics.mean(response_times):.2f}s")
-        print(f"  - Variance: {statistics.variance(response_times):.2f}")
-        print(f"  - Min: {min(response_times):.2f}s")
-        print(f"  - Max: {max(response_times):.2f}s")
+        mean, variance, fastest, slowest = summarize(response_times)
+        print(f"  - Average: {mean:.2f}s")
+        print(f"  - Variance: {variance:.2f}")
+        print(f"  - Min: {fastest:.2f}s")
+        print(f"  - Max: {slowest:.2f}s")
+    
+    # Per-turn quality trend
+    print(f"\n📈 Quality by Turn:")
+    for turn_number, scores in enumerate(quality_history, start=1):
+        if scores is None:
+            print(f"  - Turn {turn_number}: no metrics (turn failed)")
+        else:
+            print(f"  - Turn {turn_number}: " + ", ".join(
+                f"{key.title()} {score:.0%}" for key, score in zip(QUALITY_KEYS, scores)
+            ))
     
     # Checkpoint summary
     print(f"\n💾 Checkpoint Summary:")
@@ -7,7 +7,9 @@ Tests various personality combinations in AI debates.
 """
 
 import asyncio
+import io
 import json
+import logging
 import os
 import sys
 from datetime import datetime
@@ -16,28 +18,57 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.session_manager import SessionManager
+from core.console import SHOW_PREVIEWS
+from core.debate_loop import run_debate
 from agents.specialized.debate_agent_a import DebateAgentA  
 from agents.specialized.debate_agent_b import DebateAgentB
 
+logger = logging.getLogger(__name__)
 
-async def test_personality_combination(pro_personality, con_personality, topic="技術進歩は人類の幸福に必要か？"):
-    """Test a specific personality combination"""
+
+# Optional pause between turns in seconds; off unless DEMO_PACE_SECONDS is set
+PACE_SECONDS = float(os.getenv("DEMO_PACE_SECONDS", "0"))
+
+# Combinations debated at the same time (keep within the Gemini rate limit)
+CONCURRENCY = int(os.getenv("DEMO_CONCURRENCY", "3"))
+
+# Responses longer than this are truncated in the console preview
+PREVIEW_LENGTH = 200
+
+
+def _preview(text, limit=PREVIEW_LENGTH):
+    """Return text, truncated with "..." when longer than limit"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+async def test_personality_combination(pro_personality, con_personality, topic="技術進歩は人類の幸福に必要か？",
+                                       session_manager=None, out=None):
+    """Test a specific personality combination (optionally on a shared session manager)
     
-    print(f"\n{'='*80}")
-    print(f"🧪 性格テスト: {pro_personality.upper()} vs {con_personality.upper()}")
-    print(f"{'='*80}")
-    print(f"トピック: {topic}")
-    print(f"{'='*80}\n")
+    Console output goes to out (default: sys.stdout).
+    """
+    if out is None:
+        out = sys.stdout
     
-    # Initialize session manager
-    session_manager = SessionManager()
+    print("\n" + "="*80, file=out)
+    print(f"🧪 性格テスト: {pro_personality.upper()} vs {con_personality.upper()}", file=out)
+    print("="*80, file=out)
+    print(f"トピック: {topic}", file=out)
+    print("="*80 + "\n", file=out)
+    
+    # Initialize session manager unless one is shared by the caller
+    if session_manager is None:
+        session_manager = SessionManager()
     
     # Create agents with different personalities
     pro_agent = DebateAgentA.create_default(pro_personality, f"{pro_personality.title()}賛成派")
     con_agent = DebateAgentB.create_default(con_personality, f"{con_personality.title()}反対派")
     
-    print(f"✅ {pro_agent.name} (賛成側) 準備完了")
-    print(f"✅ {con_agent.name} (反対側) 準備完了\n")
+    # Load Node.js and the CLI bundle ahead of turn 1 so their cold start is not timed
+    await asyncio.gather(pro_agent.warm_up(), con_agent.warm_up())
+    
+    print(f"✅ {pro_agent.name} (賛成側) 準備完了", file=out)
+    print(f"✅ {con_agent.name} (反対側) 準備完了\n", file=out)
     
     # Create session
     participants = [
@@ -51,64 +82,44 @@ async def test_personality_combination(pro_personality, con_personality, topic="
         max_turns=4  # 2 turns each for quick test
     )
     
-    print(f"🎯 セッション開始: {session.session_id}")
-    print(f"📝 トピック: {topic}\n")
+    print(f"🎯 セッション開始: {session.session_id}", file=out)
+    print(f"📝 トピック: {topic}\n", file=out)
     
-    # Start the debate
-    current_message = ""
+    def announce_turn(turn_number, agent, role):
+        print(f"--- ターン {turn_number}: {agent.name} の{role} ---", file=out)
+        logger.info(f"🤔 {agent.name} が考え中...")
     
-    for turn in range(4):  # 4 turns total (2 each)
-        turn_number = turn + 1
-        
-        if turn % 2 == 0:  # Pro agent's turn
-            agent = pro_agent
-            print(f"--- ターン {turn_number}: {agent.name} の主張 ---")
-        else:  # Con agent's turn  
-            agent = con_agent
-            print(f"--- ターン {turn_number}: {agent.name} の反論 ---")
-        
-        print(f"🤔 {agent.name} が考え中...")
-        
-        # Generate response
-        response = await agent.generate_response(
-            topic=topic,
-            opponent_message=current_message,
-            context="",
-            turn_number=turn_number
-        )
-        
-        print(f"\n💬 {agent.name}:")
-        print("-" * 60)
-        # Show first 200 characters only for demo 
-        response_preview = response[:200] + "..." if len(response) > 200 else response
-        print(response_preview)
-        print("-" * 60 + "\n")
-        
-        # Add turn to session
-        session_manager.add_turn(
-            session_id=session.session_id,
-            agent_id=agent.agent_id,
-            agent_name=agent.name,
-            message=response,
-            response_time=1.5
-        )
-        
-        # Update current message for next agent
-        current_message = response
-        
-        # Brief pause between turns
-        if turn < 3:
-            await asyncio.sleep(2)
+    async def show_response(turn_number, agent, response):
+        print(f"\n💬 {agent.name}:", file=out)
+        print("-" * 60, file=out)
+        # Show the first PREVIEW_LENGTH characters only for demo
+        print(_preview(response), file=out)
+        print("-" * 60 + "\n", file=out)
+    
+    # Speaking order: pro and con alternate, 4 turns total (2 each)
+    turn_plan = [(pro_agent, "主張"), (con_agent, "反論")] * 2
+    
+    # Start the debate
+    await run_debate(
+        turn_plan,
+        session_manager,
+        session,
+        topic,
+        response_time=1.5,
+        pace_seconds=PACE_SECONDS,
+        on_turn_start=announce_turn,
+        on_response=show_response if SHOW_PREVIEWS else None
+    )
     
     # Get final session summary
     summary = session_manager.get_session_summary(session.session_id)
     
-    print("=" * 80)
-    print(f"🎉 {pro_personality.upper()} vs {con_personality.upper()} 議論完了！")
-    print("=" * 80)
-    print(f"📊 総ターン数: {summary['turn_count']}")
-    print(f"💾 セッションID: {summary['session_id']}")
-    print("=" * 80 + "\n")
+    print("=" * 80, file=out)
+    print(f"🎉 {pro_personality.upper()} vs {con_personality.upper()} 議論完了！", file=out)
+    print("=" * 80, file=out)
+    print(f"📊 総ターン数: {summary['turn_count']}", file=out)
+    print(f"💾 セッションID: {summary['session_id']}", file=out)
+    print("=" * 80 + "\n", file=out)
     
     return session.session_id
 
@@ -137,28 +148,45 @@ async def main():
             "伝統的価値観の現代社会での意義"
         ]
         
-        session_ids = []
+        # Each combination uses its own session, so they can run concurrently.
+        # One session manager serves them all; its calls never await, so the
+        # tasks cannot interleave inside it
+        session_manager = SessionManager()
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        
+        async def run_bounded(pro_personality, con_personality, topic):
+            # Each combination prints into its own buffer, written out in one
+            # piece when it finishes, so concurrent runs do not interleave
+            report = io.StringIO()
+            try:
+                async with semaphore:
+                    return await test_personality_combination(
+                        pro_personality,
+                        con_personality,
+                        topic,
+                        session_manager,
+                        out=report
+                    )
+            finally:
+                sys.stdout.write(report.getvalue())
+                sys.stdout.flush()
         
-        for i, (pro_personality, con_personality) in enumerate(combinations):
-            topic = topics[i % len(topics)]
-            
-            session_id = await test_personality_combination(
-                pro_personality, 
-                con_personality, 
-                topic
-            )
-            session_ids.append(session_id)
-            
-            # Pause between tests
-            if i < len(combinations) - 1:
-                print("⏳ 次のテストまで5秒待機...\n")
-                await asyncio.sleep(5)
+        session_ids = await asyncio.gather(
+            *(
+                run_bounded(pro_personality, con_personality, topics[i % len(topics)])
+                for i, (pro_personality, con_personality) in enumerate(combinations)
+            ),
+            return_exceptions=True
+        )
         
         # Final summary
         print("🎯 全テスト完了！")
         print("📋 セッションID一覧:")
-        for session_id in session_ids:
-            print(f"  - {session_id}")
+        for (pro_personality, con_personality), session_id in zip(combinations, session_ids):
+            if isinstance(session_id, Exception):
+                print(f"  - ❌ {pro_personality} vs {con_personality}: {str(session_id)}")
+            else:
+                print(f"  - {session_id}")
         print("\n✨ 各性格の特徴がよく表れた議論ができました！")
         
     except Exception as e:
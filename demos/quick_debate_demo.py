@@ -7,7 +7,9 @@ Demonstrates the AI debate system with a simple 2-agent discussion.
 """
 
 import asyncio
+import functools
 import json
+import logging
 import os
 import sys
 from datetime import datetime
@@ -16,9 +18,24 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.session_manager import SessionManager
+from core.console import buffered_stdout
+from core.debate_loop import run_debate
 from agents.specialized.debate_agent_a import DebateAgentA  
 from agents.specialized.debate_agent_b import DebateAgentB
 
+logger = logging.getLogger(__name__)
+
+
+# Optional pause between turns in seconds; off unless DEMO_PACE_SECONDS is set
+PACE_SECONDS = float(os.getenv("DEMO_PACE_SECONDS", "0"))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_scenario(path):
+    """Load a scenario file once; callers must treat the result as read-only"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 async def run_debate_demo():
     """Run a quick AI vs AI debate demonstration"""
@@ -37,13 +54,15 @@ async def run_debate_demo():
     pro_agent = DebateAgentA.create_logical("テクノ楽観主義者")
     con_agent = DebateAgentB.create_emotional("ヒューマン擁護者")
     
+    # Load Node.js and the CLI bundle ahead of turn 1 so their cold start is not timed
+    await asyncio.gather(pro_agent.warm_up(), con_agent.warm_up())
+    
     print(f"✅ {pro_agent.name} (論理派・賛成側) 準備完了")
     print(f"✅ {con_agent.name} (感情派・反対側) 準備完了\n")
     
     # Load scenario
     scenario_path = "discussions/scenarios/ai_humanity_ally.json"
-    with open(scenario_path, 'r', encoding='utf-8') as f:
-        scenario = json.load(f)
+    scenario = await asyncio.to_thread(_load_scenario, scenario_path)
     
     # Create session
     participants = [
@@ -60,51 +79,39 @@ async def run_debate_demo():
     print(f"🎯 議論セッション開始: {session.session_id}")
     print(f"📝 トピック: {scenario['title']}\n")
     
-    # Start the debate
     topic = scenario["title"]
-    current_message = ""
     
-    for turn in range(4):  # 4 turns total (2 each)
-        turn_number = turn + 1
-        
-        if turn % 2 == 0:  # Pro agent's turn
-            agent = pro_agent
-            print(f"--- ターン {turn_number}: {agent.name} の主張 ---")
-        else:  # Con agent's turn  
-            agent = con_agent
-            print(f"--- ターン {turn_number}: {agent.name} の反論 ---")
-        
-        print(f"🤔 {agent.name} が考え中...")
-        
-        # Generate response
-        response = await agent.generate_response(
-            topic=topic,
-            opponent_message=current_message,
-            context=scenario.get("context", ""),
-            turn_number=turn_number
-        )
-        
-        print(f"\n💬 {agent.name}:")
-        print("-" * 60)
-        print(response)
-        print("-" * 60 + "\n")
-        
-        # Add turn to session
-        session_manager.add_turn(
-            session_id=session.session_id,
-            agent_id=agent.agent_id,
-            agent_name=agent.name,
-            message=response,
-            response_time=2.0  # Approximate response time
-        )
-        
-        # Update current message for next agent
-        current_message = response
-        
-        # Brief pause between turns
-        if turn < 3:
-            print("⏳ 次のターンまで3秒待機...\n")
-            await asyncio.sleep(3)
+    def announce_turn(turn_number, agent, role):
+        print(f"--- ターン {turn_number}: {agent.name} の{role} ---")
+        logger.info(f"🤔 {agent.name} が考え中...")
+    
+    async def show_response(turn_number, agent, response):
+        with buffered_stdout():
+            print(f"\n💬 {agent.name}:")
+            print("-" * 60)
+            print(response)
+            print("-" * 60 + "\n")
+    
+    async def announce_pause(turn_number, turn):
+        if turn_number < len(turn_plan) and PACE_SECONDS > 0:
+            print(f"⏳ 次のターンまで{PACE_SECONDS:g}秒待機...\n")
+    
+    # Speaking order: pro and con alternate, 4 turns total (2 each)
+    turn_plan = [(pro_agent, "主張"), (con_agent, "反論")] * 2
+    
+    # Start the debate
+    await run_debate(
+        turn_plan,
+        session_manager,
+        session,
+        topic,
+        context=scenario.get("context", ""),
+        response_time=2.0,  # Approximate response time
+        pace_seconds=PACE_SECONDS,
+        on_turn_start=announce_turn,
+        on_response=show_response,
+        on_turn=announce_pause
+    )
     
     # Get final session summary
     summary = session_manager.get_session_summary(session.session_id)